@@ -0,0 +1,67 @@
+"""
+Compare blit throughput of graphics as loaded from their PNGs (the previous
+``GraphicsManager.load`` behavior) versus prepared in the display's pixel format,
+with opaque graphics converted without an alpha channel.
+
+Usage::
+
+    python benchmarks/bench_blit_formats.py
+"""
+
+import os
+import time
+from typing import Dict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from pygame.surface import Surface  # noqa: E402
+
+from treeshavelegs.game import Game  # noqa: E402
+from treeshavelegs.types import GameOptions, WorldStage  # noqa: E402
+from treeshavelegs.utils import is_opaque  # noqa: E402
+from treeshavelegs.utils.paths import game_paths  # noqa: E402
+
+BLITS = 20_000
+
+
+def measure(screen: Surface, gfx: Surface) -> float:
+    width = max(1, screen.get_width() - gfx.get_width())
+    height = max(1, screen.get_height() - gfx.get_height())
+    positions = [((i * 7) % width, (i * 5) % height) for i in range(BLITS)]
+    start = time.perf_counter()
+    for position in positions:
+        screen.blit(gfx, position)
+
+    return BLITS / (time.perf_counter() - start)
+
+
+def report(screen: Surface, name: str, loaded: Dict[str, Surface], prepared: Dict[str, Surface]):
+    old = sum(measure(screen, gfx) for gfx in loaded.values()) / len(loaded)
+    new = sum(measure(screen, gfx) for gfx in prepared.values()) / len(prepared)
+    print(f"{name} ({len(loaded)} graphics)")
+    print(f"  as loaded: {old:10.0f} blits/s")
+    print(f"  prepared:  {new:10.0f} blits/s ({new / old:.1f}x)")
+
+
+def main():
+    options = GameOptions(stage=WorldStage.GET_TAYLOR_BACK, disable_music=True, disable_sfx=True)
+    game = Game(options)
+    game.setup()
+    screen = game.display.active.screen
+
+    opaque: Dict[str, Surface] = {}
+    translucent: Dict[str, Surface] = {}
+    for path in sorted(game_paths.gfx.glob("*.png")):
+        gfx = pygame.image.load(str(path))
+        group = opaque if is_opaque(gfx) else translucent
+        group[path.stem] = gfx
+
+    for name, loaded in (("opaque", opaque), ("translucent", translucent)):
+        prepared = {gfx_id: game.graphics.prepare(gfx) for gfx_id, gfx in loaded.items()}
+        report(screen, name, loaded, prepared)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Measure the cost of collision detection as the number of moving sprites grows:
+pairing up the sprites once per tick (``CollisionManager.update``), then moving them
+with ``MobileSprite.move``, which sweeps each sprite against its ``neighbors()``.
+For comparison, also times sweeping a sprite against every sprite in the group.
+
+Usage::
+
+    python benchmarks/bench_collision.py
+"""
+
+import os
+import random
+import time
+from math import floor, isqrt
+from typing import List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from treeshavelegs.constants import BLOCK_SIZE  # noqa: E402
+from treeshavelegs.game import Game  # noqa: E402
+from treeshavelegs.sprites.base import MobileSprite  # noqa: E402
+from treeshavelegs.types import GameOptions, WorldStage  # noqa: E402
+from treeshavelegs.utils.spatial import get_impact  # noqa: E402
+
+SIZES = (10, 100, 1_000, 10_000)
+TICKS = 20
+
+# Moves swept against every sprite, per size. Sweeping them all is too slow.
+BRUTE_FORCE_MOVES = 200
+
+# Blocks of space per sprite, so density stays the same as the area grows.
+SPACING = 4
+
+
+def brute_force(game: Game, target: MobileSprite, dx: int, dy: int):
+    # Only the sprites, as tiles are found the same way either way.
+    hitbox = target.hitbox
+    for sprite in game.collision.group:
+        if sprite is not target:
+            get_impact(hitbox, sprite.hitbox, dx, dy)
+
+
+def main():
+    random.seed(0)
+    options = GameOptions(stage=WorldStage.GET_TAYLOR_BACK, disable_music=True, disable_sfx=True)
+    game = Game(options)
+    game.setup()
+    game.clock.deltatime = 1 / game.options.tick_rate
+    collision = game.collision
+    player = game.sprites.player
+
+    # Start from an empty collision group.
+    for sprite in collision.group.sprites():
+        collision.group.remove(sprite)
+
+    movers: List[MobileSprite] = []
+    for size in SIZES:
+        side = isqrt(size * SPACING * SPACING) * BLOCK_SIZE
+        for mover in movers:
+            mover.kill()
+
+        movers = []
+        for i in range(size):
+            mover = MobileSprite(
+                f"mover-{i}",
+                "black",
+                (collision.group,),
+                position=(random.randrange(side), random.randrange(side)),
+            )
+            mover.max_speed = player.max_speed
+            movers.append(mover)
+
+        # Moves stay within the reach the broadphase pairs sprites by.
+        step = floor(player.speed)
+        collision.update()
+        update = move = 0.0
+        tested = collision.pairs_tested
+        for _ in range(TICKS):
+            start = time.perf_counter()
+            collision.update()
+            update += time.perf_counter() - start
+
+            steps = [(random.randint(-step, step), random.randint(-step, step)) for _ in movers]
+            start = time.perf_counter()
+            for mover, (dx, dy) in zip(movers, steps):
+                mover.move((mover.hitbox.x + dx, mover.hitbox.y + dy))
+
+            move += time.perf_counter() - start
+
+        neighbors = sum(len(collision.neighbors(m)) for m in movers) / size
+        tested = (collision.pairs_tested - tested) / TICKS
+        sample = random.sample(movers, min(size, BRUTE_FORCE_MOVES))
+        start = time.perf_counter()
+        for mover in sample:
+            brute_force(game, mover, random.randint(-step, step), random.randint(-step, step))
+
+        brute = (time.perf_counter() - start) / len(sample)
+        print(
+            f"{size:>6} sprites: update {update / TICKS * 1_000:7.2f} ms/tick "
+            f"({tested:8.0f} pairs tested), "
+            f"move {move / (TICKS * size) * 1_000_000:5.1f} us "
+            f"({neighbors:4.1f} neighbors), "
+            f"every sprite {brute * 1_000_000:8.1f} us/sweep"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Compare the cost of drawing the ground: blitting every tile sprite each frame
+(the previous ``CameraGroup.draw_in_view`` behavior) versus blitting the chunks
+of the ``GroundLayer`` near the view, and report how the chunk cache behaved.
+
+Usage::
+
+    python benchmarks/bench_ground_layer.py
+"""
+
+import os
+import random
+import time
+from typing import Callable, List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from pygame.math import Vector2  # noqa: E402
+from pygame.rect import Rect  # noqa: E402
+
+from treeshavelegs.constants import BLOCK_SIZE, MAP_VOID, Maps  # noqa: E402
+from treeshavelegs.game import Game  # noqa: E402
+from treeshavelegs.managers.map import Map, MapCharacterData, MapMetaData  # noqa: E402
+from treeshavelegs.types import GameOptions, WorldStage  # noqa: E402
+
+FRAMES = 300
+# Tiles per side. Drawing every tile of the large map is too slow to bother measuring,
+# so the medium map is the largest one both ways are compared on.
+MEDIUM_MAP_SIZE = 150
+LARGE_MAP_SIZE = 500
+
+
+def generate_map(size: int) -> Map:
+    tile_set = {
+        "0": {"gfx": "grass"},
+        "1": {"gfx": "road"},
+        "D": {"gfx": "debris", "collision": True},
+        MAP_VOID: {"gfx": "black", "collision": True},
+    }
+    rows = []
+    for y in range(size):
+        if y in (0, size - 1):
+            rows.append([MAP_VOID] * size)
+        else:
+            inner = random.choices(["0", "1", "D"], weights=[8, 2, 1], k=size - 2)
+            rows.append([MAP_VOID, *inner, MAP_VOID])
+
+    player = MapCharacterData(sprite_id="player", rect=Rect(BLOCK_SIZE, BLOCK_SIZE, 32, 32))
+    metadata = MapMetaData(map_id="generated", tile_set=tile_set, player=player, world_sprites=[])
+    return Map(map_id="generated", metadata=metadata, tiles=rows)
+
+
+def per_tile(game: Game, offset: Vector2):
+    surface = game.world.group.surface
+    for sprite in sorted(game.world.ground.sprites(), key=lambda s: s.rect.centery):
+        surface.blit(sprite.image, sprite.rect.topleft - offset)
+
+
+def chunked(game: Game, offset: Vector2):
+    game.world.ground.draw_in_view(game.world.group.surface, offset)
+
+
+def measure(game: Game, fn: Callable[[Game, Vector2], None]) -> float:
+    # Pan diagonally across the whole map, leaving chunks behind the camera.
+    width = game.map.width * BLOCK_SIZE
+    height = game.map.height * BLOCK_SIZE
+    offsets: List[Vector2] = [
+        Vector2(i * width // FRAMES, i * height // FRAMES) - Vector2(game.display.half_width, 0)
+        for i in range(FRAMES)
+    ]
+    start = time.perf_counter()
+    for offset in offsets:
+        fn(game, offset)
+
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def report(game: Game, name: str, compare: bool = True):
+    tiles = len(game.world.ground)
+    print(f"{name} ({tiles} tiles)")
+    if compare:
+        print(f"  per-tile: {measure(game, per_tile):8.3f} ms/frame")
+
+    game.world.ground.invalidate()
+    chunks = game.world.ground.chunks
+    builds, hits, evictions = chunks.builds, chunks.cache.hits, chunks.cache.evictions
+    print(f"  chunked:  {measure(game, chunked):8.3f} ms/frame")
+    print(
+        f"  chunks: {chunks.builds - builds} built, {chunks.cache.hits - hits} hits, "
+        f"{chunks.cache.evictions - evictions} evicted, "
+        f"{chunks.cache.size / 1024 / 1024:.1f} MB cached"
+    )
+
+
+def main():
+    random.seed(0)
+    options = GameOptions(stage=WorldStage.GET_TAYLOR_BACK, disable_music=True, disable_sfx=True)
+    game = Game(options)
+    game.setup()
+    assert game.map.map_id == Maps.BUFFER_PROPERTY
+    report(game, Maps.BUFFER_PROPERTY)
+
+    for size in (MEDIUM_MAP_SIZE, LARGE_MAP_SIZE):
+        game.map.active = generate_map(size)
+        game.sprites.create_sprites(skip=["world_sprites"])
+        report(game, f"generated {size}x{size}", compare=size <= MEDIUM_MAP_SIZE)
+
+
+if __name__ == "__main__":
+    main()
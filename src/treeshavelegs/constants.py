@@ -47,7 +47,29 @@ class Views:
 DEFAULT_WIDTH = 1200
 DEFAULT_HEIGHT = 800
 DEFAULT_FPS = 32
+DEFAULT_TICK_RATE = 32
 DEFAULT_FONT_SIZE = 25
+DEFAULT_RENDER_SCALE = 2
+DEFAULT_GROUND_CACHE_MB = 32
+
+# Sprites within this many pixels of each other, plus how far they can move in a tick,
+# are paired up by the collision broadphase to be checked against each other when
+# moving. It changes how many pairs are checked, not what collides.
+DEFAULT_BROADPHASE_MARGIN = 3 * BLOCK_SIZE
+
+# How far the player looks for things to activate. It must cover how far things can be
+# activated from, such as a block-sized item at three times its size.
+ACTIVATE_RADIUS = 2 * BLOCK_SIZE
+
+# The ground is rendered in square chunks of this many tiles per side.
+GROUND_CHUNK_TILES = 16
+
+# Profiling keeps timings for this many of the most recent frames.
+PROFILE_WINDOW_FRAMES = 300
+
+# Cache budgets, in bytes
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+GFX_VARIANT_CACHE_BYTES = 16 * 1024 * 1024
 
 # Default attributes
 DEFAULT_HP = 100
@@ -1,13 +1,12 @@
 from typing import List
 
-from pygame.key import ScancodeWrapper  # type: ignore
-from pygame.key import get_pressed
 from pygame.math import Vector2
 
-from treeshavelegs.types import KeyBinding
+from treeshavelegs.managers.base import ManagerAccess
+from treeshavelegs.types import KeyBinding, KeysPressed
 
 
-class Controller:
+class Controller(ManagerAccess):
     """
     Class wrapping the controller keys around and handling the
     direction and focus of the controller.
@@ -19,8 +18,8 @@ class Controller:
         self.bindings = bindings
 
     @property
-    def keys_pressed(self) -> ScancodeWrapper:
-        return get_pressed()
+    def keys_pressed(self) -> KeysPressed:
+        return self.input.get_pressed()
 
     @property
     def movement_keys_pressed(self) -> List[int]:
@@ -1,3 +1,5 @@
+import os
+from time import perf_counter
 from traceback import format_exc
 
 import pygame
@@ -5,23 +7,38 @@ import pygame
 from treeshavelegs.logging import game_logger
 from treeshavelegs.managers.base import ManagerAccess
 from treeshavelegs.types import GameEvent, GameOptions
-from treeshavelegs.utils import quit
+from treeshavelegs.utils import get_peak_memory_mb, quit
 
 
 class Game(ManagerAccess):
     def __init__(self, game_options: GameOptions):
         super().__init__()
+        if game_options.headless:
+            # Must be set before initializing pygame.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.init()
         self.running = False
         self.options.load(game_options)
 
+        # Replays may change options, so load them before anything uses them.
+        self.input.load()
+        self.rng.load()
+        self.input.start()
+        self.profiler.load()
+
     def start(self):
         """
         Start the game.
         Does game setup and then runs the game
         """
         self.setup()
-        self.run()
+        if self.options.headless:
+            self.simulate()
+        else:
+            self.run()
+
         quit()
 
     def setup(self):
@@ -67,6 +84,33 @@ class Game(ManagerAccess):
                 else:
                     game_logger.error(format_exc())
 
+    def simulate(self):
+        """
+        Runs the game without a window, as fast as possible,
+        for ``--ticks`` ticks. Then, reports how it performed.
+        """
+
+        self.running = True
+        start = perf_counter()
+        while self.running and self.clock.ticks < self.options.ticks:
+            self.react()
+
+        elapsed = perf_counter() - start
+        ticks = self.clock.ticks
+        game_logger.info(f"Ran {ticks} ticks in {elapsed:.2f}s ({ticks / elapsed:.0f} ticks/s).")
+        for name, timer in sorted(self.clock.timers.items(), key=lambda t: -t[1].elapsed):
+            game_logger.info(
+                f"  {name}: {timer.elapsed:.0f} ms total, {timer.elapsed / ticks:.3f} ms/tick"
+            )
+
+        collision = self.collision
+        game_logger.info(
+            f"Broadphase: {collision.builds} builds, {collision.pairs_tested} pairs tested, "
+            f"{collision.pairs_found} found."
+        )
+        game_logger.info(f"Peak memory: {get_peak_memory_mb():.1f} MB.")
+        game_logger.info(f"Player ended at {self.sprites.player.rect.topleft}.")
+
     def react(self):
         """
         React to game events.
@@ -79,9 +123,11 @@ class Game(ManagerAccess):
                     quit()
 
                 case GameEvent.MENU:
-                    self.clock.paused = True
                     self.views.goto(self.menu)
                     self.views.active.run()
 
+                case GameEvent.IDLE:
+                    self.audio.update()
+
                 case GameEvent.CONTINUE:
                     self.views.active.run()
@@ -3,6 +3,8 @@ import click
 from treeshavelegs.game import Game
 from treeshavelegs.options import game_options
 from treeshavelegs.types import GameOptions
+from treeshavelegs.utils.atlas import pack_atlas
+from treeshavelegs.utils.paths import game_paths
 
 
 @click.command("play_thl")
@@ -15,3 +17,13 @@ def cli(*args, **kwargs):
     options = GameOptions(*args, **kwargs)
     game = Game(options)
     game.start()
+
+
+@click.command("thl_pack_atlas")
+def pack_atlas_cli():
+    """
+    Pack the graphics into a texture atlas, loaded by the game in place of the loose files.
+    Re-run after changing any graphics.
+    """
+
+    pack_atlas(game_paths.gfx, game_paths.atlas)
@@ -14,9 +14,12 @@ if TYPE_CHECKING:
     from .event import EventManager
     from .graphics import GraphicsManager
     from .hud import HUDManager
+    from .input import InputManager
     from .map import MapManager
     from .menu import MenuManager
     from .options import OptionsManager
+    from .profile import ProfileManager
+    from .rng import RNGManager
     from .sprite import SpriteManager
     from .state import StateManager
     from .view import ViewManager
@@ -91,6 +94,14 @@ class ManagerAccess:
 
         return cast("HUDManager", self._("hud"))
 
+    @cached_property
+    def input(self) -> "InputManager":
+        """
+        Where the player's input comes from: pygame, or a replay.
+        """
+
+        return cast("InputManager", self._("input"))
+
     @cached_property
     def map(self) -> "MapManager":
         """
@@ -115,6 +126,22 @@ class ManagerAccess:
 
         return cast("OptionsManager", self._("options"))
 
+    @cached_property
+    def profiler(self) -> "ProfileManager":
+        """
+        Times each part of the game loop, with ``--profile``.
+        """
+
+        return cast("ProfileManager", self._("profile"))
+
+    @cached_property
+    def rng(self) -> "RNGManager":
+        """
+        Seeded random numbers, in a stream per subsystem.
+        """
+
+        return cast("RNGManager", self._("rng"))
+
     @cached_property
     def sprites(self) -> "SpriteManager":
         """
@@ -164,10 +191,27 @@ class BaseManager(ManagerAccess):
 
 
 class ViewController(BaseManager):
+    # Static views only change on input, so they wait for it
+    # rather than redrawing every frame. The game is paused meanwhile.
+    static: bool = False
+
     def __init__(self, view_id: str, group: AbstractGroup | None = None) -> None:
         super().__init__()
         self.view_id = view_id
         self.group = group
+        self.drawn = False
+
+    def activate(self):
+        """
+        Called when the view becomes the active view.
+        """
+
+        self.display.refresh()
+        self.drawn = False
+        if self.static:
+            self.clock.paused = True
+        elif self.clock.paused:
+            self.clock.resume()
 
     def handle_event(self, event: Event):
         """
@@ -192,10 +236,20 @@ class ViewController(BaseManager):
 
     def run(self):
         """Run the view."""
-        self.update()
-        self.audio.update()
+        for _ in self.clock.steps():
+            self.update()
+
+        with self.clock.timers["audio"]:
+            self.audio.update()
+
         with self.display.in_same_cycle():
-            self.draw()
+            with self.clock.timers["draw"]:
+                self.draw()
+
+            self.profiler.draw()
+
+        self.profiler.end_frame()
+        self.drawn = True
 
 
 ROOT_MODULE = ".".join(BaseManager.__module__.split(".")[:-1])
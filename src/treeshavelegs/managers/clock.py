@@ -1,17 +1,85 @@
+from collections import defaultdict
+from typing import DefaultDict, Iterator
+
 import pygame
 
 from treeshavelegs.managers.base import BaseManager
+from treeshavelegs.utils.timer import Stopwatch
+
+# When frames take too long, skip ahead rather than trying to catch up forever.
+MAX_TICKS_PER_FRAME = 8
 
 
 class ClockManager(BaseManager):
+    """
+    Runs the simulation in fixed ticks of ``1 / --tick-rate`` seconds,
+    independent of the frame rate. Each frame runs however many ticks fit in
+    the time since the last frame. What is left over is ``alpha``, how far
+    (0 to 1) the frame is between the last two ticks, for drawing in between them.
+    """
+
     def __init__(self):
         super().__init__()
         self._clock = pygame.time.Clock()
         self.paused = False
+
+        # Seconds simulated per tick. Speeds are scaled by this.
         self.deltatime: float = 0.0
 
+        # Seconds the last frame actually took.
+        self.frametime: float = 0.0
+
+        self.accumulator: float = 0.0
+        self.ticks: int = 0
+        self.alpha: float = 1.0
+
+        # Total time spent in each part of the game loop, by name.
+        self.timers: DefaultDict[str, Stopwatch] = defaultdict(Stopwatch)
+
     def tick(self):
-        self.deltatime = self._clock.tick(self.options.fps) / 1000
+        if self.options.headless:
+            # Do not wait.
+            self.frametime = 1 / self.options.tick_rate
+        else:
+            self.frametime = self._clock.tick(self.options.fps) / 1000
+
+        if self.paused:
+            return
+
+        elif self.options.headless or self.input.replaying:
+            # Run exactly one tick per frame.
+            self.accumulator += 1 / self.options.tick_rate
+        else:
+            self.accumulator += self.frametime
+
+    def resume(self):
+        """
+        Continue the simulation from now, as if no time passed while paused.
+        """
+
+        self.paused = False
+        self.accumulator = 0.0
+        self._clock.tick()
+
+    def steps(self) -> Iterator[int]:
+        """
+        Iterate once per tick due, yielding the tick's number.
+        """
+
+        self.deltatime = 1 / self.options.tick_rate
+        for _ in range(MAX_TICKS_PER_FRAME):
+            if self.accumulator < self.deltatime:
+                break
+
+            self.accumulator -= self.deltatime
+            self.ticks += 1
+            yield self.ticks
+
+        else:
+            # Fell behind. Drop the backlog.
+            self.accumulator %= self.deltatime
+
+        self.alpha = self.accumulator / self.deltatime
 
 
 clock_manager = ClockManager()
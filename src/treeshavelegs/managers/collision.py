@@ -1,87 +1,243 @@
-from typing import Callable, Iterator
+from bisect import insort
+from math import ceil, floor
+from typing import Dict, List, Tuple, cast
 
-from pygame.sprite import Group
+from pygame.rect import Rect
 
+from treeshavelegs.constants import BLOCK_SIZE
 from treeshavelegs.logging import game_logger
 from treeshavelegs.managers.base import BaseManager
 from treeshavelegs.sprites.base import BaseSprite, MobileSprite
+from treeshavelegs.types import Collision
+from treeshavelegs.utils.spatial import IndexedGroup, Normal, get_impact
+
+# Easing in can take sprites a little past their full speed.
+EASE_LIMIT = 1.1
 
 
 class CollisionManager(BaseManager):
+    """
+    Once per tick, the broadphase pairs up the sprites in the collision group whose
+    hitboxes are within ``reach`` of each other: ``--broadphase-margin``, plus how
+    much closer two sprites can get during the tick. Movement then only checks
+    a sprite against its ``neighbors()``, so the margin can be anything.
+
+    Pairing everything is a sweep-and-prune along x. After that, only the sprites
+    that moved are paired again, using the spatial index.
+    """
+
     def __init__(self) -> None:
         super().__init__()
-        self.group: Group = Group()
 
-    @property
-    def _sprites(self) -> Iterator[BaseSprite]:
-        for sprite in self.group.sprites():
-            if isinstance(sprite, BaseSprite):
-                yield sprite
+        # Indexed by hitbox, for finding the sprites in an area.
+        # Sprites reindex themselves when they move.
+        self.group: IndexedGroup = IndexedGroup(key="hitbox")
+
+        # Each sprite's neighbors, in the order they were added to the group.
+        self.broadphase: Dict[BaseSprite, List[BaseSprite]] = {}
+        self.reach: float = 0.0
+        self.stale = True
+
+        # Where the sprites were when last paired, to tell which moved.
+        self.positions: Dict[BaseSprite, Tuple[int, int]] = {}
+        self._version = -1
+
+        # Totals, for profiling.
+        self.builds = 0
+        self.pairs_tested = 0
+        self.pairs_found = 0
+
+    def update(self):
+        """
+        Pair up the sprites for this tick.
+        """
+
+        reach = self._get_reach()
+        if self.stale or self._version != self.group.version or reach > self.reach:
+            self.build(reach)
+            return
+
+        positions = self.positions
+        for sprite in self.group:
+            position = sprite.hitbox.topleft
+            if position != positions[sprite]:
+                self._repair(sprite)
+                positions[sprite] = position
+
+    def teleported(self, sprite: BaseSprite):
+        """
+        Pair up a sprite again right away, after it jumped rather than moved.
+        """
+
+        if self.stale or self._version != self.group.version or sprite not in self.broadphase:
+            # Paired when next asked about.
+            return
+
+        self._repair(sprite)
+        self.positions[sprite] = sprite.hitbox.topleft
+
+    def build(self, reach: float | None = None):
+        """
+        Pair up every sprite, using sweep-and-prune.
+        """
+
+        self.reach = self._get_reach() if reach is None else reach
+        half = self.reach / 2
+        order = self.group.index.order
+        boxes = sorted(
+            (
+                (
+                    sprite.hitbox.left - half,
+                    sprite.hitbox.right + half,
+                    sprite.hitbox.top - half,
+                    sprite.hitbox.bottom + half,
+                    sprite,
+                )
+                for sprite in self.group
+            ),
+            key=lambda b: b[0],
+        )
+        broadphase: Dict[BaseSprite, List[BaseSprite]] = {b[4]: [] for b in boxes}
+        active: List[Tuple] = []
+        tested = found = 0
+        for box in boxes:
+            left, _, top, bottom, sprite = box
+
+            # Sweep along x, dropping the boxes that end before this one starts.
+            active = [a for a in active if a[1] > left]
+            tested += len(active)
+            for other in active:
+                if other[2] < bottom and top < other[3]:
+                    broadphase[sprite].append(other[4])
+                    broadphase[other[4]].append(sprite)
+                    found += 1
+
+            active.append(box)
+
+        for neighbors in broadphase.values():
+            neighbors.sort(key=order.__getitem__)
+
+        self.broadphase = broadphase
+        self.positions = {sprite: sprite.hitbox.topleft for sprite in broadphase}
+        self.stale = False
+        self._version = self.group.version
+        self.builds += 1
+        self.pairs_tested += tested
+        self.pairs_found += found
+
+    def neighbors(self, sprite: BaseSprite) -> List[BaseSprite]:
+        """
+        Get the sprites that may touch or be near the sprite this tick,
+        in the order they were added to the group.
+        """
+
+        self._ensure_built()
+        return self.broadphase.get(sprite, [])
 
     def validate(self):
         assert self.group is not None
         game_logger.debug("Collision-detection ready.")
 
-    def check_x(self, target: MobileSprite) -> BaseSprite | None:
-        def fn(sprite: BaseSprite):
-            if not self.collides(target, sprite):
-                return None
-
-            elif target.direction.x < 0:
-                target.hitbox.x += round(target.speed)
-                target.ease.reset()
-                return sprite
-
-            elif target.direction.x > 0:
-                target.hitbox.x -= round(target.speed)
-                target.ease.reset()
-                return sprite
-
-            # Not sure it's possible  to get here.
-            return None
-
-        return self._check(fn)
-
-    def check_y(self, target: MobileSprite) -> BaseSprite | None:
-        def fn(sprite):
-            if not self.collides(target, sprite):
-                return None
-
-            elif target.direction.y < 0:
-                target.hitbox.y += round(target.speed)
-                target.ease.reset()
-                return sprite
-
-            elif target.direction.y > 0:
-                target.hitbox.y -= round(target.speed)
-                target.ease.reset()
-                return sprite
-
-            # Not sure it's possible  to get here.
-            return None
-
-        return self._check(fn)
-
-    def collides(self, sprite_0: BaseSprite, sprite_1: BaseSprite) -> bool:
-        if sprite_0.sprite_id == sprite_1.sprite_id:
-            # Ignore when sprites are the same
-            return False
-
-        if sprite_0.hitbox.colliderect(sprite_1.hitbox):
-            id_0 = sprite_0.sprite_id
-            id_1 = sprite_1.sprite_id
-            game_logger.debug(f"Collision between '{id_0}' and '{id_1}' detected.")
-            return True
-
-        return False
-
-    def _check(self, fn: Callable) -> BaseSprite | None:
-        for sprite in self._sprites:
-            collided = fn(sprite)
-            if collided is not None:
-                return collided
-
-        return None
+    def sweep(self, target: MobileSprite, dx: int, dy: int) -> Collision:
+        """
+        Find what the target's hitbox would hit first, moving by ``(dx, dy)``.
+        Sprites are checked before tiles, each in the order they were added.
+        """
+
+        hitbox = target.hitbox
+        first: Tuple[float, Normal] | None = None
+        hit: BaseSprite | None = None
+        for sprite in self.neighbors(target):
+            impact = get_impact(hitbox, sprite.hitbox, dx, dy)
+            if impact is not None and (first is None or impact[0] < first[0]):
+                first, hit = impact, sprite
+
+        hit_cell: Tuple[int, int] | None = None
+        for x, y in self.map.solid_cells(hitbox.union(hitbox.move(dx, dy))):
+            cell = Rect(x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+            impact = get_impact(hitbox, cell, dx, dy)
+            if impact is not None and (first is None or impact[0] < first[0]):
+                first, hit_cell = impact, (x, y)
+
+        if first is None:
+            return Collision()
+
+        elif hit_cell is not None:
+            hit = self.sprites.tile_at(*hit_cell)
+
+        assert hit is not None
+        time, normal = first
+        game_logger.debug(f"Collision between '{target.sprite_id}' and '{hit.sprite_id}'.")
+        if normal[0]:
+            return Collision(x=hit, other=hit, normal=normal, time=time)
+
+        return Collision(y=hit, other=hit, normal=normal, time=time)
+
+    def advance(self, target: MobileSprite, dx: int, dy: int) -> Collision:
+        """
+        Move the target's hitbox by ``(dx, dy)``, stopping where it first hits something.
+        """
+
+        if not dx and not dy:
+            return Collision()
+
+        collision = self.sweep(target, dx, dy)
+        if collision.other is None:
+            target.hitbox.move_ip(dx, dy)
+
+        # Along the axis of the hit, the distance to the contact is whole.
+        elif collision.normal[0]:
+            target.hitbox.move_ip(round(dx * collision.time), int(dy * collision.time))
+        else:
+            target.hitbox.move_ip(int(dx * collision.time), round(dy * collision.time))
+
+        return collision
+
+    def candidates(self, rect: Rect) -> List[BaseSprite]:
+        """
+        Get the sprites in the cells the rect touches, in the order they were added.
+        Their hitboxes are not guaranteed to touch ``rect``.
+        """
+        return cast(List[BaseSprite], self.group.index.query(rect))
+
+    def _ensure_built(self):
+        if self.stale or self._version != self.group.version:
+            self.build()
+
+    def _get_reach(self) -> float:
+        fastest = max((s.speed for s in self.group if isinstance(s, MobileSprite)), default=0.0)
+
+        # Each of two sprites can get up to a pixel further, rounding where it moves to.
+        return self.options.broadphase_margin + 2 * (EASE_LIMIT * fastest + 1)
+
+    def _repair(self, sprite: BaseSprite):
+        """
+        Pair up a sprite that moved again.
+        """
+
+        broadphase = self.broadphase
+        for other in broadphase[sprite]:
+            broadphase[other].remove(sprite)
+
+        hitbox = sprite.hitbox
+        reach = self.reach
+        left, right = hitbox.left - reach, hitbox.right + reach
+        top, bottom = hitbox.top - reach, hitbox.bottom + reach
+        area = Rect(floor(left), floor(top), ceil(right - left), ceil(bottom - top))
+        order = self.group.index.order
+        neighbors = []
+        for other in self.candidates(area):
+            if other is sprite:
+                continue
+
+            self.pairs_tested += 1
+            box = other.hitbox
+            if left < box.right and box.left < right and top < box.bottom and box.top < bottom:
+                neighbors.append(other)
+                insort(broadphase[other], sprite, key=order.__getitem__)
+
+        broadphase[sprite] = neighbors
+        self.pairs_found += len(neighbors)
 
 
 collision_manager = CollisionManager()
@@ -1,17 +1,20 @@
 from contextlib import contextmanager
+from typing import Dict, List, Tuple
 
-from pygame import BLEND_RGBA_MULT, DOUBLEBUF, FULLSCREEN, SRCALPHA
-from pygame.display import flip, set_caption, set_mode, update
+from pygame import DOUBLEBUF, FULLSCREEN
+from pygame.display import set_caption, set_mode, update
 from pygame.font import Font, SysFont
 from pygame.rect import Rect
 from pygame.surface import Surface
 from pygame.transform import scale as scale_fn
 
-from treeshavelegs.constants import GAME_NAME, RGB
+from treeshavelegs.constants import DEFAULT_RENDER_SCALE, GAME_NAME, RGB, TEXT_CACHE_BYTES
 from treeshavelegs.logging import game_logger
 from treeshavelegs.managers.base import BaseManager
-from treeshavelegs.types import GfxID, Positional
+from treeshavelegs.types import FontName, GfxID, Positional
+from treeshavelegs.utils.cache import LRUCache, surface_bytes
 from treeshavelegs.utils.paths import game_paths
+from treeshavelegs.utils.timer import Stopwatch
 
 
 class Display:
@@ -25,6 +28,8 @@ class Display:
         height: int,
         font_size: int,
         full_screen: bool = False,
+        dirty_rects: bool = False,
+        render_scale: int = DEFAULT_RENDER_SCALE,
     ) -> None:
         modes = DOUBLEBUF
         if full_screen:
@@ -35,18 +40,86 @@ class Display:
         self.window = set_mode((width, height), modes)
 
         # self.screen is scaled up to the window size to properly increase the size of all graphics.
-        self.width = width // 2
-        self.height = height // 2
+        # A larger render scale means fewer pixels to draw, at a lower resolution.
+        self.scale = render_scale
+        self.width = width // render_scale
+        self.height = height // render_scale
         self.screen = Surface((self.width, self.height))
 
+        # Scale straight into the window when it matches the scaled screen exactly.
+        # Else, scale into a buffer allocated once here.
+        scaled_size = (self.width * render_scale, self.height * render_scale)
+        if (
+            self.window.get_size() == scaled_size
+            and self.window.get_bitsize() == self.screen.get_bitsize()
+        ):
+            self.scaled = self.window
+        else:
+            self.scaled = Surface(scaled_size)
+
+        # Time spent scaling and presenting during the last update, in milliseconds.
+        self.scale_timer = Stopwatch()
+        self.present_timer = Stopwatch()
+
         self.font = SysFont("comic-sans", font_size)
 
+        # In dirty-rect mode, only the areas of the screen marked dirty get presented.
+        self.dirty_rects = dirty_rects
+        self.dirty: List[Rect] = []
+        self.full_refresh = True
+
         set_caption(GAME_NAME)
 
+    def mark_dirty(self, rect: Rect):
+        if self.dirty_rects and not self.full_refresh:
+            self.dirty.append(rect)
+
+    def refresh(self):
+        """
+        Present the whole screen on the next update.
+        """
+        self.full_refresh = True
+
     def update(self):
-        screen = scale_fn(self.screen, (self.width * 2, self.height * 2))
-        self.window.blit(screen, (0, 0))
-        update()
+        self.scale_timer.reset()
+        self.present_timer.reset()
+
+        if self.full_refresh or not self.dirty_rects:
+            self._scale(self.screen.get_rect())
+            with self.present_timer:
+                update()
+
+        else:
+            bounds = self.screen.get_rect()
+            window_rects = []
+            for rect in self.dirty:
+                rect = rect.clip(bounds)
+                if rect:
+                    window_rects.append(self._scale(rect))
+
+            if window_rects:
+                with self.present_timer:
+                    update(window_rects)
+
+        self.dirty = []
+        self.full_refresh = False
+
+    def _scale(self, rect: Rect) -> Rect:
+        """
+        Scale an area of the screen up onto the window.
+        Returns the area of the window that changed.
+        """
+
+        scale = self.scale
+        window_rect = Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+        with self.scale_timer:
+            source = self.screen.subsurface(rect)
+            destination = self.scaled.subsurface(window_rect)
+            scale_fn(source, window_rect.size, destination)
+            if self.scaled is not self.window:
+                self.window.blit(self.scaled, window_rect, area=window_rect)
+
+        return window_rect
 
     def clear(self):
         self.screen.fill(RGB["black"])
@@ -60,9 +133,17 @@ class DisplayManager(BaseManager):
             self.options.window_height,
             self.options.font_size,
             full_screen=self.options.full_screen,
+            dirty_rects=self.options.dirty_rects,
+            render_scale=self.options.render_scale,
         )
         self.active = self.main
 
+        # Opening and rendering fonts is slow, so keep what was made.
+        self.fonts: Dict[Tuple[FontName, int], Font] = {}
+        self.text_cache: LRUCache[Tuple[str, int, str, bool], Surface] = LRUCache(
+            TEXT_CACHE_BYTES, sizer=surface_bytes
+        )
+
         # Initialize in a cleared state.
         self.active.clear()
 
@@ -93,9 +174,24 @@ class DisplayManager(BaseManager):
         self.tick()
 
     def tick(self):
-        self.display.active.update()
-        flip()
-        self.clock.tick()
+        if not self.options.headless:
+            with self.clock.timers["present"]:
+                self.display.active.update()
+
+        with self.clock.timers["tick"]:
+            self.clock.tick()
+
+    def mark_dirty(self, rect: Rect):
+        """
+        Mark an area of the screen as changed, for dirty-rect mode.
+        """
+        self.active.mark_dirty(rect)
+
+    def refresh(self):
+        """
+        Present the whole screen next frame, such as after changing views.
+        """
+        self.active.refresh()
 
     def show_graphic(
         self,
@@ -104,22 +200,16 @@ class DisplayManager(BaseManager):
         x_scale: int | None = None,
         y_scale: int | None = None,
         transparent: bool = False,
-    ):
-        graphic = self.graphics[gfx_id]
-        rect = graphic.get_rect()
-
-        if x_scale or y_scale:
-            x_scale = x_scale or 1
-            y_scale = y_scale or 1
-            graphic = scale_fn(graphic, (rect.width * x_scale, rect.height * y_scale))
-
-        if transparent:
-            alpha_surface = Surface(graphic.get_size(), SRCALPHA)
-            alpha_surface.fill((255, 255, 255, 10))
-            graphic.blit(alpha_surface, (0, 0), special_flags=BLEND_RGBA_MULT)
+        surface: Surface | None = None,
+    ) -> Rect:
+        scale = (x_scale or 1, y_scale or 1)
+        alpha = 10 if transparent else None
+        graphic = self.graphics.get_variant(gfx_id, scale=scale, alpha=alpha)
+        if graphic is None:
+            raise IndexError(f"Graphics with ID '{gfx_id}' not found.")
 
         destination = self._get_destination(graphic, position)
-        self.active.screen.blit(graphic, destination)
+        return (surface or self.active.screen).blit(graphic, destination)
 
     def show_text(
         self,
@@ -128,12 +218,24 @@ class DisplayManager(BaseManager):
         position: Positional | str,
         color: str,
         antialias: bool = True,
-    ):
-        font_file = game_paths.get_font("want-coffee")
-        font = Font(str(font_file), font_size)
-        surface = font.render(text, antialias, RGB[color])
-        destination = self._get_destination(surface, position)
-        self.active.screen.blit(surface, destination)
+        surface: Surface | None = None,
+    ) -> Rect:
+        key = (text, font_size, color, antialias)
+        rendered = self.text_cache.get(key)
+        if rendered is None:
+            rendered = self.get_font(font_size).render(text, antialias, RGB[color])
+            self.text_cache[key] = rendered
+
+        destination = self._get_destination(rendered, position)
+        return (surface or self.active.screen).blit(rendered, destination)
+
+    def get_font(self, font_size: int, font_name: FontName = "want-coffee") -> Font:
+        key = (font_name, font_size)
+        if key not in self.fonts:
+            font_file = game_paths.get_font(font_name)
+            self.fonts[key] = Font(str(font_file), font_size)
+
+        return self.fonts[key]
 
     def clear(self):
         self.active.clear()
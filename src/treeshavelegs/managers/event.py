@@ -1,28 +1,44 @@
 from typing import Iterable
 
 from pygame import QUIT
-from pygame.event import get as get_events
 
 from treeshavelegs.constants import Views
 from treeshavelegs.managers.base import BaseManager
 from treeshavelegs.types import GameEvent, UserInput
 
+# How long static views sleep before waking up to keep the music going.
+IDLE_TIMEOUT_MS = 500
+
 
 class EventManager(BaseManager):
     @property
     def queue(self) -> Iterable[GameEvent]:
         """
-        Allow an event to affect how sprites update.
-        Event processing happens before sprites updating.
+        Allow events to affect how sprites update.
+        All pending events are handled before the frame's single update and draw.
         """
 
-        for event in get_events():
+        if self.input.finished:
+            yield GameEvent.QUIT
+            return
+
+        # Nothing changes in static views until there is input. Sleep until then.
+        view = self.views.active
+        idle = view.static and view.drawn
+        events = self.input.get_events(wait_ms=IDLE_TIMEOUT_MS if idle else None)
+        if idle and not events:
+            yield GameEvent.IDLE
+            return
+
+        for event in events:
             # Handle exiting game
             escape_key = self.options.key_bindings.escape
             escape_key_pressed = event.type == UserInput.KEY_DOWN and event.key == escape_key
             if escape_key_pressed and Views.MENU not in self.views.active.view_id:
+                # The menu handles the rest of the events. Replays, for one,
+                # have the keys pressed in the menu in the same batch.
                 yield GameEvent.MENU
-                return  # Return early to prevent double-processing.
+                continue
 
             elif event.type == QUIT:
                 yield GameEvent.QUIT
@@ -30,12 +46,8 @@ class EventManager(BaseManager):
 
             self.views.active.handle_event(event)
 
-            # Continue before processing next event.
-            yield GameEvent.CONTINUE
-
-        else:
-            # No events.
-            yield GameEvent.CONTINUE
+        # Continue to the next frame, once for all the events.
+        yield GameEvent.CONTINUE
 
 
 event_manager = EventManager()
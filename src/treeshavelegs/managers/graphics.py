@@ -1,17 +1,37 @@
-from typing import Dict
+from functools import cached_property
+from typing import Dict, Tuple
 
 import pygame
+from pygame import BLEND_RGBA_MULT, SRCALPHA
+from pygame.display import get_surface
 from pygame.surface import Surface
 
-from treeshavelegs.constants import BLOCK_SIZE, RGB
+from treeshavelegs.constants import BLOCK_SIZE, GFX_VARIANT_CACHE_BYTES, RGB
 from treeshavelegs.managers.base import BaseManager
-from treeshavelegs.types import GfxID
+from treeshavelegs.types import Color, GfxID
+from treeshavelegs.utils import is_opaque
+from treeshavelegs.utils.atlas import load_atlas
+from treeshavelegs.utils.cache import LRUCache, surface_bytes
 from treeshavelegs.utils.paths import game_paths
 
+# (gfx_id, (x_scale, y_scale), alpha, tint, flip_x)
+VariantKey = Tuple[GfxID, Tuple[int, int], int | None, Color | None, bool]
+
 
 class GraphicsManager(BaseManager):
     gfx_cache: Dict[str, Surface] = {}
 
+    def __init__(self) -> None:
+        super().__init__()
+
+        # Where each cached graphic came from: (gfx_id, flip_x).
+        self.sources: Dict[Surface, Tuple[GfxID, bool]] = {}
+
+        # Scaled, tinted and transparent versions of graphics, made on demand.
+        self.variants: LRUCache[VariantKey, Surface] = LRUCache(
+            GFX_VARIANT_CACHE_BYTES, sizer=surface_bytes
+        )
+
     def __getitem__(self, gfx_id: GfxID | None) -> Surface:
         if gfx_id is None:
             return self.get_filled_surface("black")
@@ -22,33 +42,102 @@ class GraphicsManager(BaseManager):
 
         return gfx
 
+    @cached_property
+    def atlas(self) -> Dict[str, Surface]:
+        """
+        Graphics cut from the packed atlas (see ``thl_pack_atlas``), by cache ID.
+        Empty when there is no up-to-date atlas.
+        """
+        return load_atlas(game_paths.gfx, game_paths.atlas, prepare=self.prepare)
+
     def get(self, gfx_id: GfxID, flip_x: bool = False) -> Surface | None:
-        if flip_x:
-            # Handle the case where we need to flip the graphic vertically.
-            gfx_cache_id = f"{gfx_id}-right"
-            if gfx_cache_id in self.gfx_cache:
-                return self.gfx_cache[gfx_cache_id]
+        # Flipped graphics are cached separately.
+        gfx_cache_id = f"{gfx_id}-right" if flip_x else gfx_id
+        if gfx_cache_id in self.gfx_cache:
+            return self.gfx_cache[gfx_cache_id]
 
-            gfx = self.get(gfx_id)
-            if not gfx:
+        gfx = self.atlas.get(gfx_cache_id)
+        if gfx is None and flip_x:
+            # Handle the case where we need to flip the graphic vertically.
+            original = self.get(gfx_id)
+            if not original:
                 return None
 
-            gfx = pygame.transform.flip(gfx, True, False)
-            self.gfx_cache[gfx_cache_id] = gfx
-            return gfx
+            gfx = pygame.transform.flip(original, True, False)
 
-        elif gfx_id in self.gfx_cache:
-            return self.gfx_cache[gfx_id]
+        elif gfx is None:
+            gfx = self.load(gfx_id)
 
-        gfx = self.load(gfx_id)
-        self.gfx_cache[gfx_id] = gfx
+        self.gfx_cache[gfx_cache_id] = gfx
+        self.sources[gfx] = (gfx_id, flip_x)
         return gfx
 
+    def identify(self, gfx: Surface) -> Tuple[GfxID, bool] | None:
+        """
+        Get the ``(gfx_id, flip_x)`` a graphic from ``.get()`` was made from.
+        """
+        return self.sources.get(gfx)
+
+    def get_variant(
+        self,
+        gfx_id: GfxID,
+        scale: Tuple[int, int] = (1, 1),
+        alpha: int | None = None,
+        tint: Color | None = None,
+        flip_x: bool = False,
+    ) -> Surface | None:
+        """
+        Get a graphic scaled by whole factors, with its colors multiplied by ``tint``
+        and/or its transparency multiplied by ``alpha / 255``.
+        Variants are made once and cached.
+        """
+
+        key = (gfx_id, scale, alpha, tint, flip_x)
+        variant = self.variants.get(key)
+        if variant is not None:
+            return variant
+
+        gfx = self.get(gfx_id, flip_x=flip_x)
+        if gfx is None:
+            return None
+
+        variant = gfx
+        if scale != (1, 1):
+            width, height = gfx.get_size()
+            variant = pygame.transform.scale(gfx, (width * scale[0], height * scale[1]))
+
+        if alpha is not None and not variant.get_flags() & SRCALPHA:
+            # Opaque graphics are prepared without an alpha channel to multiply.
+            with_alpha = Surface(variant.get_size(), SRCALPHA)
+            with_alpha.blit(variant, (0, 0))
+            variant = with_alpha
+
+        if alpha is not None or tint is not None:
+            # Never alter the cached original.
+            variant = variant.copy() if variant is gfx else variant
+            multiplier = Surface(variant.get_size(), SRCALPHA)
+            multiplier.fill((*(tint or RGB["white"]), 255 if alpha is None else alpha))
+            variant.blit(multiplier, (0, 0), special_flags=BLEND_RGBA_MULT)
+
+        self.variants[key] = variant
+        return variant
+
     def load(self, gfx_id: GfxID) -> Surface:
         path = game_paths.get_graphic(gfx_id)
-        gfx = pygame.image.load(path)
-        gfx.convert_alpha()  # Allows transparency
-        return gfx
+        return self.prepare(pygame.image.load(path))
+
+    def prepare(self, gfx: Surface) -> Surface:
+        """
+        Convert a graphic to the display's pixel format, so blitting it
+        does not convert every pixel each time. Opaque graphics, such as
+        ground tiles, drop the alpha channel to skip blending altogether.
+        """
+
+        if get_surface() is None:
+            # No display mode set yet to convert to.
+            return gfx
+
+        return gfx.convert() if is_opaque(gfx) else gfx.convert_alpha()
 
     def get_filled_surface(
         self, color: str, width: int = BLOCK_SIZE, height: int = BLOCK_SIZE
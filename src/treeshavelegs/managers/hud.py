@@ -1,4 +1,7 @@
+from typing import Any, Dict, List, Tuple
+
 import pygame
+from pygame import SRCALPHA
 from pygame.rect import Rect
 from pygame.surface import Surface
 
@@ -11,6 +14,25 @@ class HUDItem(ManagerAccess):
     def __init__(self, display_surface: Surface) -> None:
         self.display_surface = display_surface
 
+    @property
+    def bounds(self) -> Rect:
+        """
+        The area of the screen the item draws in.
+        """
+        return self.display_surface.get_rect()
+
+    @property
+    def appearance(self) -> Tuple[Any, ...]:
+        """
+        Everything the item's appearance depends on.
+        """
+        return ()
+
+    def draw(self):
+        """
+        Draw the item on the display surface.
+        """
+
 
 class Bar(HUDItem):
     def __init__(
@@ -33,6 +55,14 @@ class Bar(HUDItem):
         self.max = max
         self.horizontal = horizontal
 
+    @property
+    def bounds(self) -> Rect:
+        return self.rect
+
+    @property
+    def appearance(self) -> Tuple[Any, ...]:
+        return (self.current, self.max)
+
     def draw(self):
         # Draw background
         pygame.draw.rect(self.display_surface, RGB["onyx"], self.rect)
@@ -56,9 +86,9 @@ class Bar(HUDItem):
 
 
 class HealthBar(Bar):
-    def __init__(self) -> None:
+    def __init__(self, surface: Surface) -> None:
         super().__init__(
-            self.display.active.screen,
+            surface,
             (10, 10),
             20,
             128,
@@ -74,10 +104,10 @@ class HealthBar(Bar):
 
 
 class CalmBar(Bar):
-    def __init__(self) -> None:
+    def __init__(self, surface: Surface) -> None:
         super().__init__(
-            self.display.active.screen,
-            (self.display.active.screen.get_width() - 2 * BLOCK_SIZE, 10),
+            surface,
+            (surface.get_width() - 2 * BLOCK_SIZE, 10),
             128,
             20,
             "blue",
@@ -86,6 +116,10 @@ class CalmBar(Bar):
             horizontal=False,
         )
 
+    @property
+    def bounds(self) -> Rect:
+        return self.rect.union(Rect(self.rect.x - 5, self.rect.y + 90, BLOCK_SIZE, BLOCK_SIZE))
+
     def update(self):
         self.current = self.sprites.runner.hysteria
 
@@ -94,14 +128,26 @@ class CalmBar(Bar):
 
         # Draw Taylor indicator.
         position = (self.rect.x - 5, self.rect.y + 90)
-        self.display.show_graphic(self.characters.runner.gfx_id, position)
+        self.display.show_graphic(
+            self.characters.runner.gfx_id, position, surface=self.display_surface
+        )
 
 
 class InventoryDisplay(HUDItem):
-    def __init__(self) -> None:
-        super().__init__(self.display.active.screen)
+    def __init__(self, surface: Surface) -> None:
+        super().__init__(surface)
         self.inventory = self.sprites.player.inventory
 
+    @property
+    def bounds(self) -> Rect:
+        max_items = len(self.options.key_bindings.inventory)
+        y = self.display_surface.get_height() - BLOCK_SIZE * 1.2
+        return Rect(BLOCK_SIZE, y, 1.5 * BLOCK_SIZE * max_items, BLOCK_SIZE)
+
+    @property
+    def appearance(self) -> Tuple[Any, ...]:
+        return tuple((item.name, item.gfx_id) for _, item in self.inventory.items())
+
     def update(self):
         self.inventory = self.sprites.player.inventory
 
@@ -110,9 +156,14 @@ class InventoryDisplay(HUDItem):
             x_offset = BLOCK_SIZE + (1.5 * BLOCK_SIZE * index)
             position = (x_offset, self.display_surface.get_height() - BLOCK_SIZE * 1.2)
             self.display.show_text(
-                f"{index + 1}", 8, (position[0] + 6, position[1] + 4), "white", antialias=False
+                f"{index + 1}",
+                8,
+                (position[0] + 6, position[1] + 4),
+                "white",
+                antialias=False,
+                surface=self.display_surface,
             )
-            self.display.show_graphic(item.gfx_id, position)
+            self.display.show_graphic(item.gfx_id, position, surface=self.display_surface)
             rect = Rect(*position, BLOCK_SIZE, BLOCK_SIZE)
             pygame.draw.rect(self.display_surface, RGB["white"], rect, 3)
 
@@ -121,35 +172,71 @@ class HUDManager(BaseManager):
     """
     The organizer of the heads-up display
     (a.k.a. the health and inventory items that show on the screen).
+
+    Items are drawn onto a transparent overlay, which is only rebuilt
+    when an item's appearance changes. Otherwise, drawing the HUD is
+    a single blit of the overlay onto the screen.
     """
 
     def __init__(self) -> None:
         super().__init__()
+        self.overlay = Surface(self.display.active.screen.get_size(), SRCALPHA)
+        self.rebuilds = 0
 
         # Universal items.
-        self.health_bar = HealthBar()
-        self.inventory = InventoryDisplay()
+        self.health_bar = HealthBar(self.overlay)
+        self.inventory = InventoryDisplay(self.overlay)
 
         # Part of WorldStage.GET_TAYLOR_BACK
         self.runner_hysteria_bar: CalmBar | None = None
 
+        # How each item looked when the overlay was last built.
+        self._drawn_appearances: Dict[HUDItem, Tuple[Any, ...]] = {}
+
+    @property
+    def items(self) -> List[HUDItem]:
+        items: List[HUDItem] = [self.health_bar, self.inventory]
+        if (
+            self.world.stage == WorldStage.GET_TAYLOR_BACK
+            and self.runner_hysteria_bar is not None  # Not created until the first update.
+        ):
+            items.append(self.runner_hysteria_bar)
+
+        return items
+
     def update(self):
         self.health_bar.update()
         self.inventory.update()
 
         if self.world.stage == WorldStage.GET_TAYLOR_BACK:
             if self.runner_hysteria_bar is None:
-                self.runner_hysteria_bar = CalmBar()
+                self.runner_hysteria_bar = CalmBar(self.overlay)
 
             self.runner_hysteria_bar.update()
 
     def draw(self):
-        self.health_bar.draw()
-        self.inventory.draw()
+        items = self.items
+        appearances = {item: item.appearance for item in items}
+        if appearances != self._drawn_appearances:
+            self.rebuild(items)
 
-        if self.world.stage == WorldStage.GET_TAYLOR_BACK:
-            assert self.runner_hysteria_bar is not None
-            self.runner_hysteria_bar.draw()
+            # Only report items that look different from last time.
+            for item in {*appearances, *self._drawn_appearances}:
+                if appearances.get(item) != self._drawn_appearances.get(item):
+                    self.display.mark_dirty(item.bounds)
+
+            self._drawn_appearances = appearances
+
+        self.display.active.screen.blits(
+            [(self.overlay, item.bounds.topleft, item.bounds) for item in items], doreturn=False
+        )
+
+    def rebuild(self, items: List[HUDItem]):
+        self.overlay.fill((0, 0, 0, 0))
+        for item in items:
+            item.draw()
+
+        self.rebuilds += 1
 
 
 hud_manager = HUDManager()
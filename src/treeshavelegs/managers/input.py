@@ -0,0 +1,180 @@
+import atexit
+import json
+from collections import deque
+from typing import IO, Deque, Dict, FrozenSet, List
+
+from pygame import NOEVENT, QUIT
+from pygame.event import Event
+from pygame.event import get as get_events
+from pygame.event import wait as wait_for_event
+from pygame.key import get_pressed
+
+from treeshavelegs.logging import game_logger
+from treeshavelegs.managers.base import BaseManager
+from treeshavelegs.types import KeysPressed, UserInput
+
+# The options a replay must run with to play out the same as its recording.
+REPLAYED_OPTIONS = ("stage", "tick_rate", "seed")
+
+
+class HeldKeys:
+    """
+    Keys held during a tick of a replay, looked up like ``pygame.key.get_pressed()``.
+    """
+
+    def __init__(self, keys: FrozenSet[int]) -> None:
+        self.keys = keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class InputManager(BaseManager):
+    """
+    Where the player's input comes from.
+    Normally, that is pygame. With ``--record``, input is also written to a log.
+    With ``--replay``, input comes from such a log instead, one tick per frame,
+    so the session plays out the same as when it was recorded.
+
+    The log has one JSON object per line: a header with the options that affect
+    the simulation, key events tagged with the tick they came before, the keys held
+    whenever they change, and the tick the recording ended on.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.held: FrozenSet[int] = frozenset()
+
+        # For recording.
+        self.log: IO[str] | None = None
+
+        # For replaying.
+        self.replay_events: Deque[Dict] = deque()
+        self.replay_held: Deque[Dict] = deque()
+        self.end_tick: int | None = None
+
+    def load(self):
+        """
+        Load the replay, per the options. Replays change options,
+        so this comes before anything else uses them.
+        """
+
+        if self.options.replay is not None:
+            self.load_replay()
+
+    def start(self):
+        """
+        Start recording, per the options. The recording's header is written here,
+        so this comes after everything that fills in options, such as the random seed.
+        """
+
+        if self.options.record is not None:
+            self.start_recording()
+
+    @property
+    def recording(self) -> bool:
+        return self.log is not None
+
+    @property
+    def replaying(self) -> bool:
+        return self.end_tick is not None
+
+    @property
+    def finished(self) -> bool:
+        """
+        ``True`` when a replay has nothing left to play.
+        """
+        return (
+            self.end_tick is not None
+            and self.clock.ticks >= self.end_tick
+            and not self.replay_events
+        )
+
+    def get_events(self, wait_ms: int | None = None) -> List[Event]:
+        """
+        Get the pending events. When there are none, wait up to ``wait_ms``
+        for some. Replays never wait.
+        """
+
+        if self.replaying:
+            # Only let the player quit. The rest of the input comes from the replay.
+            events = [e for e in get_events() if e.type == QUIT]
+            while self.replay_events and self.replay_events[0]["tick"] <= self.clock.ticks:
+                data = self.replay_events.popleft()
+                events.append(Event(data["type"], key=data["key"]))
+
+            return events
+
+        events = get_events()
+        if not events and wait_ms is not None:
+            event = wait_for_event(wait_ms)
+            events = [] if event.type == NOEVENT else [event, *get_events()]
+
+        if self.log is not None:
+            for event in events:
+                if event.type in (UserInput.KEY_DOWN, UserInput.KEY_UP):
+                    self._write({"tick": self.clock.ticks, "type": event.type, "key": event.key})
+
+        return events
+
+    def get_pressed(self) -> KeysPressed:
+        if self.replaying:
+            while self.replay_held and self.replay_held[0]["tick"] <= self.clock.ticks:
+                self.held = frozenset(self.replay_held.popleft()["held"])
+
+            return HeldKeys(self.held)
+
+        pressed = get_pressed()
+        if self.log is not None:
+            bindings = self.options.key_bindings
+            held = frozenset(k for k in (*bindings.movement, bindings.activate) if pressed[k])
+            if held != self.held:
+                self.held = held
+                self._write({"tick": self.clock.ticks, "held": sorted(held)})
+
+        return pressed
+
+    def start_recording(self):
+        self.log = self.options.record.open("w")
+        self._write({option: self.options[option] for option in REPLAYED_OPTIONS})
+        atexit.register(self.stop_recording)
+        game_logger.info(f"Recording input to '{self.options.record}'.")
+
+    def stop_recording(self):
+        if self.log is None:
+            return
+
+        self._write({"end": self.clock.ticks})
+        self.log.close()
+        self.log = None
+
+    def load_replay(self):
+        lines = self.options.replay.read_text().splitlines()
+        header, *entries = [json.loads(line) for line in lines if line]
+        for option, value in header.items():
+            self.options[option] = value
+
+        for entry in entries:
+            if "end" in entry:
+                self.end_tick = entry["end"]
+            elif "held" in entry:
+                self.replay_held.append(entry)
+            else:
+                self.replay_events.append(entry)
+
+        if self.end_tick is None:
+            # The recording did not finish. Play what there is.
+            last = [*self.replay_events, *self.replay_held]
+            self.end_tick = max((e["tick"] for e in last), default=0)
+
+        if self.options.headless and self.options.ticks is None:
+            self.options["ticks"] = self.end_tick
+
+        game_logger.info(f"Replaying {self.end_tick} ticks from '{self.options.replay}'.")
+
+    def _write(self, entry: Dict):
+        assert self.log is not None
+        self.log.write(f"{json.dumps(entry, separators=(',', ':'))}\n")
+
+
+input_manager = InputManager()
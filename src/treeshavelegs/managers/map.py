@@ -123,6 +123,13 @@ class Map:
 
 
 class MapManager(BaseManager):
+    def __init__(self) -> None:
+        super().__init__()
+
+        # A byte per tile, row by row, set when the tile is collidable.
+        # Tiles never move, so they are checked here rather than as sprites.
+        self.solid = bytearray()
+
     def __repr__(self) -> str:
         return repr(self.active)
 
@@ -163,8 +170,26 @@ class MapManager(BaseManager):
         file_path = game_paths.get_map(map_id)
         loaded_map = Map.parse_file(file_path)
         self.active = loaded_map
+        self.solid = self._get_solid(loaded_map)
         return loaded_map
 
+    def solid_cells(self, rect: Rect) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate the (column, row) of each collidable tile the rect overlaps, row by row.
+        """
+
+        width = self.width
+        left = max(rect.left // BLOCK_SIZE, 0)
+        top = max(rect.top // BLOCK_SIZE, 0)
+        right = min(max(rect.left, rect.right - 1) // BLOCK_SIZE, width - 1)
+        bottom = min(max(rect.top, rect.bottom - 1) // BLOCK_SIZE, self.height - 1)
+        solid = self.solid
+        for y in range(top, bottom + 1):
+            row = y * width
+            for x in range(left, right + 1):
+                if solid[row + x]:
+                    yield x, y
+
     def validate(self):
         assert self.player_start
         assert self.active
@@ -173,5 +198,11 @@ class MapManager(BaseManager):
     def reset(self):
         self.load(self.active.map_id)
 
+    def _get_solid(self, loaded_map: Map) -> bytearray:
+        tile_set = loaded_map.metadata.tile_set
+        solid_keys = {k for k, tile in tile_set.items() if tile.get("collision", False)}
+        solid_keys.add(MAP_VOID)
+        return bytearray(key in solid_keys for row in loaded_map for key in row)
+
 
 map_manager = MapManager()
@@ -1,7 +1,8 @@
 from functools import cached_property
-from typing import Iterator, List
+from typing import Iterator, List, Tuple
 
 from pygame.event import Event
+from pygame.rect import Rect
 
 from treeshavelegs.constants import BLOCK_SIZE, Views
 from treeshavelegs.managers.base import ViewController
@@ -10,6 +11,8 @@ from treeshavelegs.utils import noop, quit
 
 
 class ControlsScreen(ViewController):
+    static = True
+
     def __init__(self) -> None:
         super().__init__("controls", None)
         self.last_row = -1
@@ -45,11 +48,17 @@ class ControlsScreen(ViewController):
 
 
 class Menu(ViewController):
+    static = True
+
     def __init__(self, menu_id: str, choices: List[MenuItem]):
         self.choices = choices
         self.selected = 0
         super().__init__(f"{menu_id}-menu")
 
+        # What was drawn last, for dirty-rect mode.
+        self._drawn_appearance: Tuple | None = None
+        self._drawn_rects: List[Rect] = []
+
     def __iter__(self) -> Iterator[MenuItem]:
         yield from self.choices
 
@@ -63,6 +72,7 @@ class Menu(ViewController):
         start_x = self.display.half_width // 2
         start_y = self.display.half_height // 2
 
+        rects = []
         for item in self.choices:
             if item.index == self.selected:
                 font_size = 36
@@ -74,9 +84,19 @@ class Menu(ViewController):
                 x_offset = 0
 
             y_offset = start_y + (item.index * font_size) + 10
-            self.display.show_text(
+            rect = self.display.show_text(
                 item.title, font_size, (start_x + x_offset, start_y + y_offset), color
             )
+            rects.append(rect)
+
+        # Report the old and new items when the selection or titles change.
+        appearance = (self.selected, *(item.title for item in self.choices))
+        if appearance != self._drawn_appearance:
+            for rect in (*self._drawn_rects, *rects):
+                self.display.mark_dirty(rect)
+
+            self._drawn_appearance = appearance
+            self._drawn_rects = rects
 
     def handle_event(self, event: Event):
         if event.type != UserInput.KEY_DOWN:
@@ -167,7 +187,6 @@ class MainMenu(Menu):
 
     def pop(self):
         self.views.pop()
-        self.clock.paused = False
 
     def go_to_game(self):
         self.views.goto(Views.WORLD)
@@ -180,6 +199,8 @@ class MainMenu(Menu):
 
 
 class MenuManager(ViewController):
+    static = True
+
     @cached_property
     def main(self) -> Menu:
         return MainMenu()
@@ -0,0 +1,135 @@
+import atexit
+from collections import defaultdict
+from typing import DefaultDict, Dict
+
+from pygame import SRCALPHA
+from pygame.font import Font, SysFont
+from pygame.surface import Surface
+
+from treeshavelegs.constants import RGB
+from treeshavelegs.logging import game_logger
+from treeshavelegs.managers.base import BaseManager
+from treeshavelegs.utils.loaders import safe_dump
+from treeshavelegs.utils.timer import RollingStats
+
+# Re-render the overlay's numbers this often, so they can be read.
+OVERLAY_REFRESH_FRAMES = 16
+OVERLAY_LINES = 12
+OVERLAY_FONT_SIZE = 10
+OVERLAY_COLUMNS = (("p50", 104), ("p95", 138), ("p99", 172))
+OVERLAY_WIDTH = 206
+
+
+class ProfileManager(BaseManager):
+    """
+    With ``--profile`` or ``--profile-json``, keeps how long each part of the game
+    loop (``clock.timers``), and each sprite class's update, took per frame,
+    over the most recent frames.
+
+    ``--profile`` shows the slowest parts, by p95, in an overlay.
+    ``--profile-json`` writes the percentiles of every part to a file on exit.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stats: DefaultDict[str, RollingStats] = defaultdict(RollingStats)
+        self.frames = 0
+
+        # The timers' totals as of the last frame, to get the time spent this frame.
+        self.totals: Dict[str, float] = {}
+
+        self.overlay: Surface | None = None
+        self._font: Font | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.options.profile or self.options.profile_json is not None
+
+    def load(self):
+        if self.options.profile_json is not None:
+            atexit.register(self.dump)
+
+    def end_frame(self):
+        """
+        Record how long each part of the frame took.
+        """
+
+        if not self.enabled:
+            return
+
+        self.frames += 1
+        for name, timer in self.clock.timers.items():
+            self.stats[name].add(timer.elapsed - self.totals.get(name, 0.0))
+            self.totals[name] = timer.elapsed
+
+        # Presenting is timed in two parts by the display itself.
+        display = self.display.active
+        self.stats["scale"].add(display.scale_timer.elapsed)
+        self.stats["flip"].add(display.present_timer.elapsed)
+        self.stats["frame"].add(self.clock.frametime * 1000)
+
+        if self.frames % OVERLAY_REFRESH_FRAMES == 0:
+            self.overlay = None
+
+    def draw(self):
+        """
+        Draw the overlay in the top-right corner of the screen.
+        """
+
+        if not self.options.profile:
+            return
+
+        if self.overlay is None:
+            self.overlay = self._render_overlay()
+
+        screen = self.display.active.screen
+        rect = screen.blit(self.overlay, self.overlay.get_rect(topright=(screen.get_width(), 0)))
+        self.display.mark_dirty(rect)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Percentiles of the time each part of the frame took, in milliseconds.
+        """
+
+        return {name: stats.summary() for name, stats in sorted(self.stats.items())}
+
+    def dump(self):
+        path = self.options.profile_json
+        collision = self.collision
+        broadphase = {
+            "builds": collision.builds,
+            "pairs_tested": collision.pairs_tested,
+            "pairs_found": collision.pairs_found,
+        }
+        safe_dump(path, {"frames": self.frames, "timers": self.report(), "broadphase": broadphase})
+        game_logger.info(f"Wrote profile of {self.frames} frames to '{path}'.")
+
+    @property
+    def font(self) -> Font:
+        if self._font is None:
+            self._font = SysFont("monospace", OVERLAY_FONT_SIZE)
+
+        return self._font
+
+    def _render_overlay(self) -> Surface:
+        report = self.report()
+        slowest = sorted(report, key=lambda n: -report[n]["p95"])[:OVERLAY_LINES]
+        line_height = self.font.get_linesize()
+        overlay = Surface((OVERLAY_WIDTH, (len(slowest) + 1) * line_height), SRCALPHA)
+        overlay.fill((0, 0, 0, 160))
+
+        color = RGB["white"]
+        for column, x in OVERLAY_COLUMNS:
+            overlay.blit(self.font.render(column, True, color), (x, 0))
+
+        for row, name in enumerate(slowest, start=1):
+            y = row * line_height
+            overlay.blit(self.font.render(name[:16], True, color), (2, y))
+            for column, x in OVERLAY_COLUMNS:
+                value = self.font.render(f"{report[name][column]:5.2f}", True, color)
+                overlay.blit(value, (x, y))
+
+        return overlay
+
+
+profile_manager = ProfileManager()
@@ -0,0 +1,66 @@
+from random import Random, SystemRandom
+from typing import List, Tuple
+
+from treeshavelegs.logging import game_logger
+from treeshavelegs.managers.base import BaseManager
+
+# Separate streams, so that one subsystem drawing more or fewer numbers
+# does not change what the others get.
+STREAMS = ("ai",)
+
+
+class RandomStream(Random):
+    """
+    A stream of random numbers for one subsystem.
+    """
+
+    def chance(self, odds: Tuple[int, int]) -> bool:
+        """
+        Give it odds, like (5, 6) meaning 5/6, and it will tell
+        you if you randomly achieved those odds.
+        """
+
+        must, total = odds
+        return self.random() * total < must
+
+    def integers(self, low: int, high: int, count: int) -> List[int]:
+        """
+        Draw ``count`` integers in [low, high] at once.
+        """
+
+        return self.choices(range(low, high + 1), k=count)
+
+
+class RNGManager(BaseManager):
+    """
+    The source of all randomness in the game. Seeded from ``--seed``, or randomly
+    when not given, so that any session can be played out again the same.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seed: int | None = None
+        self.ai = RandomStream()
+
+    def load(self):
+        """
+        Seed the streams, per the options.
+        """
+
+        seed = self.options.seed
+        if seed is None:
+            seed = SystemRandom().randrange(2**32)
+            self.options["seed"] = seed
+
+        self.reseed(seed)
+        game_logger.info(f"Random seed: {seed}.")
+
+    def reseed(self, seed: int):
+        self.seed = seed
+        for name in STREAMS:
+            # Strings seed the same on every run, unlike hashed tuples.
+            stream: RandomStream = getattr(self, name)
+            stream.seed(f"{seed}:{name}")
+
+
+rng_manager = RNGManager()
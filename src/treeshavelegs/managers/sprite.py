@@ -3,6 +3,7 @@ from importlib import import_module
 from typing import Dict, Iterable, List, Type
 
 from pygame.event import Event
+from pygame.rect import Rect
 
 from treeshavelegs.constants import MAP_VOID, VOID_POS
 from treeshavelegs.logging import game_logger
@@ -11,7 +12,7 @@ from treeshavelegs.sprites.base import BaseSprite, InteractiveSprite, WorldSprit
 from treeshavelegs.sprites.player import Player
 from treeshavelegs.sprites.runner import Runner
 from treeshavelegs.sprites.tile import Ground, Tile, Void
-from treeshavelegs.types import Position, Positional, SpriteID
+from treeshavelegs.types import Locatable, Position, Positional, SpriteID
 
 
 class SpriteManager(BaseManager):
@@ -20,10 +21,6 @@ class SpriteManager(BaseManager):
         self._sprite_cache: Dict[SpriteID, BaseSprite] = {}
         self.world_sprite_start_positions: Dict[SpriteID, Positional] = {}
 
-    @property
-    def interative_sprites(self) -> List[InteractiveSprite]:
-        return [s for s in self.world_sprites if isinstance(s, InteractiveSprite) and s.visible]
-
     def create_sprites(self, skip: List[str] | None = None):
         skip_keys = skip or []
 
@@ -89,15 +86,17 @@ class SpriteManager(BaseManager):
         return [
             Void(Position.parse_coordinates(x=x, y=y))
             if tile_key == MAP_VOID
-            else Ground(
-                Position.parse_coordinates(x=x, y=y),
-                tile_key,
-                self.map.tile_set[tile_key].get("collision", False),
-            )
+            else Ground(Position.parse_coordinates(x=x, y=y), tile_key)
             for y, row in enumerate(self.map)
             for x, tile_key in enumerate(row)
         ]
 
+    def tile_at(self, x: int, y: int) -> Tile:
+        """
+        Get the tile in the given column and row of the map.
+        """
+        return self.tiles[y * self.map.width + x]
+
     @cached_property
     def world_sprites(self) -> List[WorldSprite]:
         sprite_list: List[WorldSprite] = []
@@ -118,6 +117,22 @@ class SpriteManager(BaseManager):
 
         return sprite_list
 
+    def within(
+        self,
+        origin: Locatable,
+        radius: float,
+        kind: Type[BaseSprite] = InteractiveSprite,
+    ) -> List[BaseSprite]:
+        """
+        Get the visible sprites of the given kind whose hitboxes are no more than
+        ``radius`` away from a sprite, rect or point, in the order they were added.
+        Only looks at sprites near ``origin``. A sprite is never within range of itself.
+        """
+
+        area = _get_area(origin)
+        found = self.collision.group.within(area, radius)
+        return [s for s in found if isinstance(s, kind) and s.visible and s is not origin]
+
     @property
     def all_sprites(self) -> Iterable[BaseSprite]:
         yield self.player
@@ -160,6 +175,16 @@ class SpriteManager(BaseManager):
 ROOT_SPRITE_MODULE = ".".join(BaseSprite.__module__.split(".")[:-1])
 
 
+def _get_area(obj: Locatable) -> Rect:
+    if isinstance(obj, BaseSprite):
+        return obj.hitbox
+
+    elif isinstance(obj, Rect):
+        return obj
+
+    return Rect(Position.from_obj(obj), (0, 0))
+
+
 def _sprite_id_to_cls(sprite_id: SpriteID) -> Type[WorldSprite]:
     parts = sprite_id.split("-")
     if parts[-1].isnumeric():
@@ -31,12 +31,15 @@ class ViewManager(BaseManager):
         Push a view to the stack.
         """
         self.stack.append(view)
+        view.activate()
 
     def pop(self) -> ViewController:
         """
         Pop a view from the stack.
         """
-        return self.stack.pop()
+        view = self.stack.pop()
+        self.active.activate()
+        return view
 
     def goto(self, view: Union[ViewController, str]):
         """
@@ -1,59 +1,277 @@
-from typing import Dict
+from typing import DefaultDict, Dict, Iterator, List, Tuple
 
 from pygame.event import Event
 from pygame.math import Vector2
+from pygame.rect import Rect
 from pygame.sprite import Group
 from pygame.surface import Surface
 
-from treeshavelegs.constants import Maps, Views
+from treeshavelegs.constants import BLOCK_SIZE, GROUND_CHUNK_TILES, RGB, Maps, Views
 from treeshavelegs.logging import game_logger
 from treeshavelegs.managers.base import ManagerAccess, ViewController
-from treeshavelegs.sprites.base import BaseSprite, Character, InGameItem
-from treeshavelegs.types import MapID, WorldStage
-from treeshavelegs.utils.timer import VisibilityTimer
+from treeshavelegs.sprites.base import BaseSprite
+from treeshavelegs.types import MapID, RenderLayer, TileKey, WorldStage
+from treeshavelegs.utils.cache import LRUCache, surface_bytes
+from treeshavelegs.utils.spatial import DepthList, IndexedGroup
+from treeshavelegs.utils.timer import Stopwatch, VisibilityTimer
 
+# (x, y) of a chunk of the ground, counted in chunks.
+Chunk = Tuple[int, int]
 
-class CameraGroup(Group):
-    def __init__(self, surface: Surface) -> None:
+CHUNK_PX = GROUND_CHUNK_TILES * BLOCK_SIZE
+
+
+class GroundChunks(ManagerAccess):
+    """
+    The ground of the map, rasterized from the map's tile data in square chunks
+    as the camera nears them. Chunks are kept in an LRU cache within the
+    ``--ground-cache-mb`` budget, so the ones furthest behind the camera go first.
+    """
+
+    def __init__(self) -> None:
+        self.cache: LRUCache[Chunk, Surface] = LRUCache(
+            self.options.ground_cache_mb * 1024 * 1024, sizer=surface_bytes
+        )
+        self.builds = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"builds": self.builds, **self.cache.stats}
+
+    def clear(self):
+        self.cache.clear()
+
+    def near(self, view: Rect) -> Iterator[Tuple[Chunk, Surface]]:
+        """
+        Get the chunks touching the view or within half a chunk of it, building
+        any that are missing.
+        """
+
+        area = view.inflate(CHUNK_PX, CHUNK_PX)
+        columns = -(-self.map.width // GROUND_CHUNK_TILES)
+        rows = -(-self.map.height // GROUND_CHUNK_TILES)
+        x_range = range(max(0, area.left // CHUNK_PX), min(columns, area.right // CHUNK_PX + 1))
+        y_range = range(max(0, area.top // CHUNK_PX), min(rows, area.bottom // CHUNK_PX + 1))
+        for y in y_range:
+            for x in x_range:
+                chunk = self.cache.get((x, y))
+                if chunk is None:
+                    chunk = self.build((x, y))
+                    self.cache[(x, y)] = chunk
+
+                yield (x, y), chunk
+
+    def build(self, chunk: Chunk) -> Surface:
+        left, top = chunk[0] * GROUND_CHUNK_TILES, chunk[1] * GROUND_CHUNK_TILES
+        right, bottom = left + GROUND_CHUNK_TILES, top + GROUND_CHUNK_TILES
+        rows = [row[left:right] for row in self.map[top:bottom]]
+        surface = Surface((len(rows[0]) * BLOCK_SIZE, len(rows) * BLOCK_SIZE))
+        surface.fill(RGB["black"])
+
+        tile_graphics: Dict[TileKey, Surface] = {}
+        blit_sequence = []
+        for y, row in enumerate(rows):
+            for x, tile_key in enumerate(row):
+                if tile_key not in tile_graphics:
+                    tile_graphics[tile_key] = self._get_tile_graphic(tile_key)
+
+                blit_sequence.append((tile_graphics[tile_key], (x * BLOCK_SIZE, y * BLOCK_SIZE)))
+
+        surface.blits(blit_sequence, doreturn=False)
+        self.builds += 1
+        return surface
+
+    def _get_tile_graphic(self, tile_key: TileKey) -> Surface:
+        # Same as the tile sprites' images.
+        gfx_id = self.map.tile_set[tile_key]["gfx"]
+        return self.graphics.get_filled_surface(gfx_id) if gfx_id in RGB else self.graphics[gfx_id]
+
+
+class GroundLayer(Group):
+    """
+    The static tiles of the map. They are drawn from chunks of the ground,
+    so drawing costs a blit per visible chunk regardless of how large the map is.
+    """
+
+    def __init__(self) -> None:
         super().__init__()
+        self.chunks = GroundChunks()
+
+        # Whether the ground looks different since it was last drawn.
+        self.changed = True
+
+    def add_internal(self, *args, **kwargs):
+        super().add_internal(*args, **kwargs)
+        self.invalidate()
+
+    def remove_internal(self, *args, **kwargs):
+        super().remove_internal(*args, **kwargs)
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Throw away the rendered chunks. They are rebuilt as they are drawn.
+        """
+        self.chunks.clear()
+        self.changed = True
+
+    def draw_in_view(self, surface: Surface, offset: Vector2):
+        view_x, view_y = round(offset.x), round(offset.y)
+        view = surface.get_rect(topleft=(view_x, view_y))
+
+        # Areas of the view outside of the map are left alone.
+        surface.blits(
+            [
+                (image, (x * CHUNK_PX - view_x, y * CHUNK_PX - view_y))
+                for (x, y), image in self.chunks.near(view)
+            ],
+            doreturn=False,
+        )
+        self.changed = False
+
+
+class CameraGroup(IndexedGroup):
+    def __init__(self, surface: Surface) -> None:
         self.surface = surface
+        self.ground = GroundLayer()
+
+        # Drawn in the order of the layers.
+        self.layers: Dict[RenderLayer, DepthList[BaseSprite]] = {
+            layer: DepthList() for layer in RenderLayer
+        }
+
+        # Where sprites were before the last tick, to draw them in between ticks.
+        self.previous: Dict[BaseSprite, Tuple[int, int]] = {}
+
+        # For dirty-rect mode: what was drawn last frame and what changed since.
+        self.track_changes = False
+        self.scrolled = True
+        self.changed: List[Rect] = []
+        self._drawn: Dict[BaseSprite, Tuple[Surface, Rect]] = {}
+        self._last_offset: Vector2 | None = None
+
+        # When profiling, each sprite class's updates are timed here.
+        self.timers: DefaultDict[str, Stopwatch] | None = None
+        super().__init__()
+
+    def add_internal(self, sprite, *args, **kwargs):
+        super().add_internal(sprite, *args, **kwargs)
+        self.layers[sprite.render_layer].add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.layers[sprite.render_layer].remove(sprite)
+
+    def reindex(self, sprite):
+        super().reindex(sprite)
+        self.layers[sprite.render_layer].resort(sprite)
+
+    def update(self, *args, **kwargs):
+        self.previous = {sprite: sprite.rect.topleft for sprite in self.spritedict}
+        if self.timers is None:
+            super().update(*args, **kwargs)
+            return
+
+        for sprite in self.sprites():
+            with self.timers[f"update:{type(sprite).__name__}"]:
+                sprite.update(*args, **kwargs)
+
+    def snap(self, sprite: BaseSprite):
+        """
+        Draw the sprite where it is now, rather than moving from where it was.
+        For example, after teleporting.
+        """
+        self.previous.pop(sprite, None)
+
+    def get_position(self, sprite: BaseSprite, alpha: float) -> Tuple[int, int]:
+        """
+        Where to draw the sprite, ``alpha`` (0 to 1) of the way from where it was
+        before the last tick to where it is now.
+        """
+
+        x, y = sprite.rect.topleft
+        previous = self.previous.get(sprite)
+        if previous is None or alpha >= 1 or previous == (x, y):
+            return x, y
+
+        previous_x, previous_y = previous
+        return (
+            round(previous_x + (x - previous_x) * alpha),
+            round(previous_y + (y - previous_y) * alpha),
+        )
+
+    def draw_in_view(self, offset: Vector2, alpha: float = 1.0):
+        self.scrolled = offset != self._last_offset or self.ground.changed
+        self._last_offset = offset.copy()
+        self.ground.draw_in_view(self.surface, offset)
 
-    def draw_in_view(self, offset: Vector2):
-        top_layer = []
-        middle_layer = []
-        for sprite in sorted(self.sprites(), key=lambda s: s.rect is not None and s.rect.centery):
-            assert isinstance(sprite, BaseSprite)  # for Mypy
-            if not sprite.visible:
+        # Only draw sprites within the camera's view.
+        view = self.surface.get_rect(topleft=(round(offset.x), round(offset.y)))
+        in_view = set(self.query(view))
+        drawn: Dict[BaseSprite, Tuple[Surface, Rect]] = {}
+        x_offset, y_offset = view.topleft
+        for layer in self.layers.values():
+            if not layer:
                 continue
 
-            # Mypy doesn't realize this is valid.
-            offset_pos: Vector2 = sprite.rect.topleft - offset  # type: ignore[operator]
-            if isinstance(sprite, Character):
-                top_layer.append((sprite.image, offset_pos))
-            elif isinstance(sprite, InGameItem):
-                middle_layer.append((sprite.image, offset_pos))
-            else:
-                # Draw ground layer
-                self.surface.blit(sprite.image, offset_pos)
+            rows = layer.between(view.top, view.bottom)
+            sprites = [s for s in rows if s.visible and s in in_view]
+            blit_sequence = []
+            for sprite in sprites:
+                x, y = self.get_position(sprite, alpha)
+                blit_sequence.append((sprite.image, (x - x_offset, y - y_offset)))
+
+            rects = self.surface.blits(blit_sequence, doreturn=self.track_changes)
+            if rects:
+                drawn.update((s, (s.image, r)) for s, r in zip(sprites, rects))
+
+        if self.track_changes:
+            self.changed = self._get_changes(drawn)
+            self._drawn = drawn
+
+    def _get_changes(self, drawn: Dict[BaseSprite, Tuple[Surface, Rect]]) -> List[Rect]:
+        """
+        Screen areas that differ from the last frame, ignoring the ground.
+        """
 
-        for img, offset in middle_layer:
-            self.surface.blit(img, offset)
+        changed = []
+        previous = dict(self._drawn)
+        for sprite, (image, rect) in drawn.items():
+            before = previous.pop(sprite, None)
+            if before is None:
+                changed.append(rect)
+            elif before[0] is not image or before[1] != rect:
+                changed.extend((before[1], rect))
 
-        for img, offset in top_layer:
-            self.surface.blit(img, offset)
+        # Sprites that are no longer drawn.
+        changed.extend(rect for _, rect in previous.values())
+        return changed
 
 
 class Camera(ManagerAccess):
     def __init__(self) -> None:
         super().__init__()
         self.offset = Vector2()
+        self.previous_offset = Vector2()
         self.followee: BaseSprite | None = None
+        self.jumped = False
 
     def update(self):
+        previous_offset = self.offset.copy()
         if self.followee is not None:
             self.offset.x = self.followee.rect.centerx - self.display.half_width
             self.offset.y = self.followee.rect.centery - self.display.half_height
 
+        # Cut straight to the followee after it teleports.
+        self.previous_offset = self.offset.copy() if self.jumped else previous_offset
+        self.jumped = False
+
+    def get_offset(self, alpha: float) -> Vector2:
+        """
+        The offset ``alpha`` (0 to 1) of the way between the last two ticks.
+        """
+        return self.offset if alpha >= 1 else self.previous_offset.lerp(self.offset, alpha)
+
 
 class EndScreen(ManagerAccess):
     def __init__(self) -> None:
@@ -61,6 +279,7 @@ class EndScreen(ManagerAccess):
         self.total_frames = 75
         self.timer = VisibilityTimer(amount=self.total_frames)
         self.gfx_id = ""
+        self.shown: bool = False
 
     @property
     def frames_left(self) -> int:
@@ -79,6 +298,11 @@ class EndScreen(ManagerAccess):
         self.timer.update(self)
 
     def draw(self):
+        if self.visible or self.shown:
+            # The end screen covers the view; present all of it.
+            self.display.refresh()
+
+        self.shown = self.visible
         if self.visible:
             transparent = self.frames_left < 0.25 * self.total_frames
             self.display.show_graphic(
@@ -91,6 +315,9 @@ class WorldManager(ViewController):
         super().__init__(Views.WORLD, CameraGroup(self.display.active.screen))
         self.camera = Camera()
         self.group: CameraGroup = self.group
+        self.group.track_changes = self.options.dirty_rects
+        if self.profiler.enabled:
+            self.group.timers = self.clock.timers
         self.end_screen = EndScreen()
         self.stage: int = self.options.stage
         self.stage_maps: Dict[int, MapID] = {
@@ -102,6 +329,10 @@ class WorldManager(ViewController):
         # Load first map
         self.load_map()
 
+    @property
+    def ground(self) -> GroundLayer:
+        return self.group.ground
+
     def validate(self):
         assert self.group is not None
         assert self.camera is not None
@@ -112,21 +343,47 @@ class WorldManager(ViewController):
         self.sprites.player.handle_event(event)
 
     def update(self):
-        self.camera.update()
-        self.group.update()
-        self.hud.update()
-        self.end_screen.update()
+        timers = self.clock.timers
+        with timers["broadphase"]:
+            self.collision.update()
+        with timers["sprites"]:
+            self.group.update()
+        with timers["camera"]:
+            self.camera.update()
+        with timers["hud"]:
+            self.hud.update()
+        with timers["end_screen"]:
+            self.end_screen.update()
 
     def draw(self):
         if self.end_screen.frames_left < 0.25 * self.end_screen.total_frames:
-            self.group.draw_in_view(self.camera.offset)
-            self.hud.draw()
+            with self.clock.timers["draw_in_view"]:
+                self.group.draw_in_view(self.camera.get_offset(self.clock.alpha), self.clock.alpha)
+
+            if self.group.scrolled:
+                self.display.refresh()
+            else:
+                for rect in self.group.changed:
+                    self.display.mark_dirty(rect)
+
+            with self.clock.timers["hud_draw"]:
+                self.hud.draw()
 
         self.end_screen.draw()
 
     def follow(self, sprite: BaseSprite):
         self.camera.followee = sprite
 
+    def snap(self, sprite: BaseSprite):
+        """
+        Stop drawing the sprite in between ticks until it moves again,
+        such as after it teleports.
+        """
+
+        self.group.snap(sprite)
+        if sprite is self.camera.followee:
+            self.camera.jumped = True
+
     def next_stage(self):
         self.stage = WorldStage.next(self.stage)
         self.display.clear()
@@ -136,5 +393,8 @@ class WorldManager(ViewController):
     def load_map(self):
         self.map.load(self.stage_maps[self.stage])
 
+        # The rendered ground belongs to the previous map.
+        self.ground.invalidate()
+
 
 world_manager = WorldManager()
@@ -1,8 +1,18 @@
 from logging import DEBUG
+from pathlib import Path
 
 import click
 
-from treeshavelegs.constants import DEFAULT_FONT_SIZE, DEFAULT_FPS, DEFAULT_HEIGHT, DEFAULT_WIDTH
+from treeshavelegs.constants import (
+    DEFAULT_BROADPHASE_MARGIN,
+    DEFAULT_FONT_SIZE,
+    DEFAULT_FPS,
+    DEFAULT_GROUND_CACHE_MB,
+    DEFAULT_HEIGHT,
+    DEFAULT_RENDER_SCALE,
+    DEFAULT_TICK_RATE,
+    DEFAULT_WIDTH,
+)
 from treeshavelegs.logging import game_logger
 
 
@@ -18,12 +28,54 @@ def fps_option():
     return click.option("--fps", default=DEFAULT_FPS, help="Frames per second.", type=int)
 
 
+def tick_rate():
+    return click.option(
+        "--tick-rate",
+        default=DEFAULT_TICK_RATE,
+        help="Game updates per second, independent of the frame rate.",
+        type=click.IntRange(min=1),
+    )
+
+
+def render_scale():
+    return click.option(
+        "--render-scale",
+        default=DEFAULT_RENDER_SCALE,
+        help="How many window pixels each game pixel covers. Higher is faster but blockier.",
+        type=click.IntRange(min=1),
+    )
+
+
+def ground_cache_mb():
+    return click.option(
+        "--ground-cache-mb",
+        default=DEFAULT_GROUND_CACHE_MB,
+        help="Memory budget for rendered chunks of the ground, in megabytes.",
+        type=click.IntRange(min=1),
+    )
+
+
+def broadphase_margin():
+    return click.option(
+        "--broadphase-margin",
+        default=DEFAULT_BROADPHASE_MARGIN,
+        help="How near sprites must be, in pixels, to be checked against each other.",
+        type=click.IntRange(min=0),
+    )
+
+
 def font_size():
     return click.option(
         "--font-size", default=DEFAULT_FONT_SIZE, help="Numeric font size.", type=int
     )
 
 
+def dirty_rects():
+    return click.option(
+        "--dirty-rects", is_flag=True, help="Only present the changed areas of the screen."
+    )
+
+
 def full_screen():
     return click.option("--full-screen", is_flag=True, help="Play in full screen mode.")
 
@@ -55,25 +107,89 @@ def stage():
     return click.option("--stage", help="The stage to start on.", default=0, type=int)
 
 
+def seed():
+    return click.option(
+        "--seed", help="Seed for random numbers, to play out the same each time.", type=int
+    )
+
+
 def raise_exceptions():
     return click.option(
         "--raise-exceptions", help="Raise exceptions and crash the game.", is_flag=True
     )
 
 
+def headless():
+    return click.option(
+        "--headless",
+        is_flag=True,
+        help="Run without a window or audio, as fast as possible, and report performance.",
+    )
+
+
+def ticks():
+    return click.option(
+        "--ticks", help="How many ticks to run in headless mode.", type=click.IntRange(min=1)
+    )
+
+
+def profile():
+    return click.option(
+        "--profile",
+        is_flag=True,
+        help="Time each part of the game loop and show the slowest in an overlay.",
+    )
+
+
+def profile_json():
+    return click.option(
+        "--profile-json",
+        help="Time each part of the game loop and write percentiles to a JSON file on exit.",
+        type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    )
+
+
+def record():
+    return click.option(
+        "--record",
+        help="Record the player's input to a file, to replay later.",
+        type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    )
+
+
+def replay():
+    return click.option(
+        "--replay",
+        help="Replay input recorded with --record, instead of reading input.",
+        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    )
+
+
 def game_options():
     def fn(f):
         f = window_width()(f)
         f = window_height()(f)
         f = fps_option()(f)
+        f = tick_rate()(f)
+        f = render_scale()(f)
+        f = ground_cache_mb()(f)
+        f = broadphase_margin()(f)
         f = font_size()(f)
         f = full_screen()(f)
+        f = dirty_rects()(f)
         f = debug()(f)
         f = save_id()(f)
         f = disable_music()(f)
         f = disable_sfx()(f)
         f = stage()(f)
+        f = seed()(f)
         f = raise_exceptions()(f)
+        f = headless()(f)
+        f = ticks()(f)
+        f = profile()(f)
+        f = profile_json()(f)
+        f = record()(f)
+        f = replay()(f)
         return f
 
     return fn
@@ -1,7 +1,6 @@
 from functools import cached_property
 from typing import Callable, Dict, Iterable, List, Tuple, Union
 
-from pygame import BLEND_RGBA_MULT, SRCALPHA
 from pygame.event import Event
 from pygame.math import Vector2
 from pygame.rect import Rect
@@ -25,8 +24,10 @@ from treeshavelegs.types import (
     Locatable,
     Position,
     Positional,
+    RenderLayer,
     SpriteID,
 )
+from treeshavelegs.utils.spatial import IndexedGroup
 
 
 class Inventory:
@@ -55,6 +56,8 @@ class Inventory:
 
 
 class BaseSprite(Sprite, ManagerAccess):
+    render_layer: RenderLayer = RenderLayer.GROUND
+
     def __init__(
         self,
         sprite_id: SpriteID,
@@ -116,17 +119,41 @@ class BaseSprite(Sprite, ManagerAccess):
         """
         return
 
+    def reindex(self):
+        """
+        Let spatially-indexed groups know this sprite's rects changed.
+        """
+        for group in self.groups():
+            if isinstance(group, IndexedGroup):
+                group.reindex(self)
+
     def set_image(self, gfx: GfxID):
         if self.gfx_id != gfx:
             self.image = self.graphics[gfx]
             self.gfx_id = gfx
 
     def is_accessible(self, obj: Union[Rect, "BaseSprite"], scalar: float = 1.1) -> bool:
+        """
+        ``True`` when this sprite's hitbox touches the other's, scaled by ``scalar``
+        about its center.
+        """
+
         rect = obj.hitbox if isinstance(obj, BaseSprite) else obj
-        new_width = round(scalar * rect.width)
-        new_height = round(scalar * rect.height)
-        scaled_rect = rect.inflate(new_width - rect.width, new_height - rect.height)
-        return self.hitbox.colliderect(scaled_rect)
+
+        # The bounds of ``rect.inflate()``, worked out without making a new rect.
+        width = round(scalar * rect.width)
+        height = round(scalar * rect.height)
+        left = rect.x - int((width - rect.width) / 2)
+        top = rect.y - int((height - rect.height) / 2)
+        hitbox = self.hitbox
+        return (
+            width > 0
+            and height > 0
+            and hitbox.left < left + width
+            and left < hitbox.right
+            and hitbox.top < top + height
+            and top < hitbox.bottom
+        )
 
 
 class Interactive:
@@ -301,41 +328,36 @@ class MobileSprite(BaseSprite):
         return self.move((new_x, new_y))
 
     def move(self, position: Positional) -> Collision:
-        collided_x = collided_y = None
-        changed_x = changed_y = False
+        """
+        Move towards the position, stopping at the first thing in the way
+        and sliding along it for the rest of the way.
+        """
+
         x, y = position
-        x_rounded = round(x)
-        y_rounded = round(y)
-        if self.hitbox.x != x_rounded:
-            pre_check = self.hitbox.x
-            self.hitbox.x = x_rounded
-            collided_x = self.collision.check_x(self)
-            self.hitbox.x = pre_check
-            changed_x = True
-
-        if self.hitbox.y != y_rounded:
-            pre_check = self.hitbox.y
-            self.hitbox.y = y_rounded
-            collided_y = self.collision.check_y(self)
-            self.hitbox.y = pre_check
-            changed_y = True
-
-        changed = False
-        if changed_x and not collided_y and not collided_x:
-            self.hitbox.x = x_rounded
-            changed = True
-        if changed_y and not collided_x and not collided_y:
-            self.hitbox.y = y_rounded
-            changed = True
-
-        if changed:
+        start_x, start_y = self.hitbox.topleft
+        end_x, end_y = round(x), round(y)
+        collision = self.collision.advance(self, end_x - start_x, end_y - start_y)
+        if collision.other is not None:
+            self.ease.reset()
+            if collision.normal[0]:
+                slide = self.collision.advance(self, 0, end_y - self.hitbox.y)
+                collision.y = slide.y
+            else:
+                slide = self.collision.advance(self, end_x - self.hitbox.x, 0)
+                collision.x = slide.x
+
+        if self.hitbox.topleft != (start_x, start_y):
             self.rect.center = self.hitbox.center
+            self.reindex()
 
-        return Collision(x=collided_x, y=collided_y)
+        return collision
 
     def force_move(self, position: Positional):
         self.hitbox.topleft = (*position,)  # type: ignore
         self.rect.center = self.hitbox.center
+        self.reindex()
+        self.collision.teleported(self)
+        self.world.snap(self)
 
     def face(self, obj: Locatable):
         """
@@ -400,12 +422,14 @@ class DamageBlinker:
             # Blink overlay remains on.
             self.interval += 1
 
-            # Blink.
-            image_copy = self.target.image.copy()
-            alpha_surface = Surface(image_copy.get_size(), SRCALPHA)
-            alpha_surface.fill((*RGB["red"], 90))
-            image_copy.blit(alpha_surface, (0, 0), special_flags=BLEND_RGBA_MULT)
-            self.target.image = image_copy
+            # Blink, by swapping in a tinted version of the current graphic.
+            source = self.target.graphics.identify(self.target.image)
+            if source is not None:
+                gfx_id, flip_x = source
+                tinted = self.target.graphics.get_variant(
+                    gfx_id, alpha=90, tint=RGB["red"], flip_x=flip_x
+                )
+                self.target.image = tinted or self.target.image
 
         elif self.on_blink and self.interval >= self.interval_length:
             # Blink overlay turns off.
@@ -433,6 +457,8 @@ class InteractiveSprite(MobileSprite, Interactive):
 
 
 class InGameItem(InteractiveSprite):
+    render_layer = RenderLayer.ITEM
+
     def handle_activate(self, activator: "BaseSprite") -> bool:
         # Prevent animation from moving character accidentally.
         if isinstance(activator, Character):
@@ -463,6 +489,8 @@ class InventorySprite(InGameItem):
 
 
 class Character(InteractiveSprite):
+    render_layer = RenderLayer.CHARACTER
+
     def __init__(
         self,
         sprite_id: SpriteID,
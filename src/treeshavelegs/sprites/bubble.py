@@ -31,17 +31,19 @@ class ChatBubble(InGameItem):
 
     def update(self, *args, **kwargs):
         self.rect = self.sprites[self.parent_id].rect.inflate((0, -5))
+        self.reindex()
         self.timer.update(self)
 
         if not self.visible:
             return
 
-        for sprite in self.collision._sprites:
-            if sprite.sprite_id != "runner" or not self.sprites[self.parent_id].is_accessible(
-                self.sprites.runner, scalar=4
-            ):
-                continue
-
+        parent = self.sprites[self.parent_id]
+        runner = self.sprites.get("runner")
+        if (
+            runner is not None
+            and self.collision.group.has(runner)
+            and parent.is_accessible(runner, scalar=4)
+        ):
             # Activate sprite.
-            assert isinstance(sprite, Interactive)  # for mypy
-            sprite.handle_activate(self)
+            assert isinstance(runner, Interactive)  # for mypy
+            runner.handle_activate(self)
@@ -9,6 +9,7 @@ from treeshavelegs.types import Positional, UserInput, WorldStage
 
 
 class FriendCardView(ViewController):
+    static = True
     SHOWN: bool = False
 
     @property
@@ -1,8 +1,9 @@
 from pygame import Surface
 from pygame.event import Event
 
+from treeshavelegs.constants import ACTIVATE_RADIUS
 from treeshavelegs.controller import Controller
-from treeshavelegs.sprites.base import Character, InventorySprite
+from treeshavelegs.sprites.base import Character, InteractiveSprite, InventorySprite
 from treeshavelegs.sprites.bubble import ChatBubble
 from treeshavelegs.types import GfxID, UserInput
 
@@ -60,7 +61,8 @@ class Player(Character):
         """
 
         acted: bool = False
-        for item in self.sprites.interative_sprites:
+        for item in self.sprites.within(self, ACTIVATE_RADIUS):
+            assert isinstance(item, InteractiveSprite)
             if self.is_accessible(item, scalar=3):
                 self.grab_animation.on = True
                 result = item.handle_activate(self)
@@ -1,5 +1,3 @@
-from random import randint
-
 from treeshavelegs.constants import BLOCK_SIZE
 from treeshavelegs.logging import game_logger
 from treeshavelegs.sprites.base import NPC, BaseSprite
@@ -36,7 +34,7 @@ class Runner(NPC):
             return
 
         if self.sprites.player.is_dead:
-            self.move(self.start_position)
+            self.force_move(self.start_position)
             self.hysteria = self.max_hysteria
             return
 
@@ -73,12 +71,11 @@ class Runner(NPC):
 
     def refocus(self):
         game_logger.debug("Taylor is refocusing.")
-        self.direction.x = randint(-1, 1)
-        self.direction.y = randint(-1, 1)
+        self.direction.x, self.direction.y = self.rng.ai.integers(-1, 1, 2)
         if not self.direction.magnitude() == 0:
             self.direction.normalize_ip()
 
-        self.attention_threshold = randint(*self.attention_threshold_range)
+        self.attention_threshold = self.rng.ai.randint(*self.attention_threshold_range)
 
     def handle_activate(self, activator: BaseSprite) -> bool:
         if (
@@ -97,7 +94,7 @@ class Runner(NPC):
         return True
 
     def calm(self):
-        new_value = randint(-2, 8)
+        new_value = self.rng.ai.randint(-2, 8)
         new_total = self.hysteria - new_value
         new_total = self._validate_value(new_total)
         self.hysteria = new_total
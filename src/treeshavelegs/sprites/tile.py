@@ -8,6 +8,11 @@ from treeshavelegs.types import Positional, TileKey
 
 
 class Tile(BaseSprite):
+    """
+    A square of the map's ground. Collidable tiles are not in the collision group.
+    They never move, so ``MapManager.solid`` is checked for them instead.
+    """
+
     def __init__(
         self,
         position: Positional,
@@ -30,11 +35,10 @@ class Tile(BaseSprite):
 
 
 class Ground(Tile):
-    def __init__(self, position: Positional, tile_key: TileKey, collision: bool) -> None:
-        groups = (self.world.group, self.collision.group) if collision else (self.world.group,)
-        super().__init__(position, tile_key, None, groups)
+    def __init__(self, position: Positional, tile_key: TileKey) -> None:
+        super().__init__(position, tile_key, None, (self.world.ground,))
 
 
 class Void(Tile):
     def __init__(self, position: Positional) -> None:
-        super().__init__(position, MAP_VOID, (0, 0), (self.world.group, self.collision.group))
+        super().__init__(position, MAP_VOID, (0, 0), (self.world.ground,))
@@ -7,7 +7,6 @@ from treeshavelegs.constants import Graphics
 from treeshavelegs.logging import game_logger
 from treeshavelegs.sprites.base import NPC, BaseSprite, Character
 from treeshavelegs.types import Positional, SpriteID, WorldStage
-from treeshavelegs.utils import chance
 
 
 class Tree(NPC):
@@ -59,7 +58,7 @@ class Tree(NPC):
                 game_logger.debug(f"Player approaches tree {self.index}.")
 
                 # TODO: Have based on difficulty.
-                if chance((1, 2)):
+                if self.rng.ai.chance((1, 2)):
                     self.come_alive()
 
     def sleep(self):
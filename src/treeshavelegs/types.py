@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Protocol, Tuple, TypeAlias, Union
 
 from pygame import (
@@ -26,9 +27,13 @@ from pygame import (
 
 from treeshavelegs.constants import (
     BLOCK_SIZE,
+    DEFAULT_BROADPHASE_MARGIN,
     DEFAULT_FONT_SIZE,
     DEFAULT_FPS,
+    DEFAULT_GROUND_CACHE_MB,
     DEFAULT_HEIGHT,
+    DEFAULT_RENDER_SCALE,
+    DEFAULT_TICK_RATE,
     DEFAULT_WIDTH,
 )
 
@@ -92,6 +97,15 @@ class Position(tuple):
 Positional = Union[Tuple[float, float], Position]
 
 
+class KeysPressed(Protocol):
+    """
+    Which keys are held, like ``pygame.key.get_pressed()``.
+    """
+
+    def __getitem__(self, key: int) -> bool:
+        ...
+
+
 class GameEvent(Enum):
     """
     An action the root Game should take, based on the event processor.
@@ -100,6 +114,7 @@ class GameEvent(Enum):
     QUIT = "QUIT"
     CONTINUE = "CONTINUE"
     MENU = "MENU"
+    IDLE = "IDLE"
 
 
 Map = List[List[TileKey]]
@@ -192,14 +207,30 @@ class WorldStage:
             return cls.END
 
 
+class RenderLayer(IntEnum):
+    """
+    The layers of the world, drawn bottom to top.
+    Within a layer, sprites lower on the screen are drawn on top.
+    """
+
+    GROUND = 0
+    ITEM = 1
+    CHARACTER = 2
+
+
 @dataclass
 class GameOptions:
     # Core settings
     window_width: int = DEFAULT_WIDTH
     window_height: int = DEFAULT_HEIGHT
     fps: int = DEFAULT_FPS
+    tick_rate: int = DEFAULT_TICK_RATE
     font_size: int = DEFAULT_FONT_SIZE
     full_screen: bool = False
+    dirty_rects: bool = False
+    render_scale: int = DEFAULT_RENDER_SCALE
+    ground_cache_mb: int = DEFAULT_GROUND_CACHE_MB
+    broadphase_margin: int = DEFAULT_BROADPHASE_MARGIN
     raise_exceptions: bool = False
 
     # Game settings
@@ -214,9 +245,41 @@ class GameOptions:
     disable_sfx: bool = False
 
     stage: int = WorldStage.FIND_FRIEND_CARD
+    seed: int | None = None
+    """Seed for random numbers. Random when not given."""
+
+    # Simulation settings
+    headless: bool = False
+    """Run without a window or audio, as fast as possible, for ``ticks`` ticks."""
+    ticks: int | None = None
+
+    # Profiling settings
+    profile: bool = False
+    """Time each part of the game loop and show the slowest in an overlay."""
+    profile_json: Path | None = None
+    """Write the timings to this file on exit."""
+
+    # Input settings
+    record: Path | None = None
+    """Record the player's input to this file."""
+    replay: Path | None = None
+    """Replay the input recorded in this file."""
 
     def __post_init__(self):
         # Ensure options are valid.
+        if self.record is not None and self.replay is not None:
+            raise ValueError("Cannot record and replay at the same time.")
+
+        if self.headless:
+            if self.ticks is None and self.replay is None:
+                raise ValueError("Headless mode requires the number of ticks to run.")
+
+            self.disable_music = True
+            self.disable_sfx = True
+
+        elif self.ticks is not None:
+            raise ValueError("Ticks are only for headless mode.")
+
         if self.save_id is not None:
             if self.stage is not None:
                 raise ValueError("Cannot set both stage and save IDs.")
@@ -236,7 +299,15 @@ class Visible(Protocol):
 @dataclass
 class Collision:
     x: Union["BaseSprite", None] = None
+    """What was hit moving along x."""
     y: Union["BaseSprite", None] = None
+    """What was hit moving along y."""
+    other: Union["BaseSprite", None] = None
+    """What was hit first."""
+    normal: Tuple[int, int] = (0, 0)
+    """The direction the side of ``other`` that was hit faces."""
+    time: float = 1.0
+    """How far (0 to 1) along the move ``other`` was hit."""
 
 
 Locatable = Union[Rect, "BaseSprite", Positional]
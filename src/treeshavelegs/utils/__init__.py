@@ -1,35 +1,49 @@
-import random
 import sys
-import time
-from typing import Tuple
 
 import pygame
+from pygame import SRCALPHA
+from pygame.mask import from_surface as mask_from_surface
+from pygame.surface import Surface
 
 from treeshavelegs.constants import BLOCK_SIZE
 
 
-def chance(odds: Tuple[int, int]) -> bool:
+def to_px(val: int) -> int:
     """
-    Give it odds, like [5, 6] meaning (5/6), and it will tell
-    you if you randomly achieved those odds.
+    Convert block size to pixels.
     """
+    return val * BLOCK_SIZE
 
-    # Use salt to throw off random algorithm.
-    salt = round(time.time()) & 7 + 3
-    random.randint(0, salt)
 
-    must, total = odds
-    must *= 100
-    total *= 100
-    res = random.randint(0, total)
-    return res <= must
+def is_opaque(surface: Surface) -> bool:
+    """
+    Check if every pixel of the surface is fully opaque,
+    such as ground tiles, which can then skip alpha blending.
+    """
 
+    if not surface.get_flags() & SRCALPHA and surface.get_colorkey() is None:
+        return True
 
-def to_px(val: int) -> int:
+    # Only pixels with an alpha over the threshold (255) are set.
+    opaque_pixels = mask_from_surface(surface, 254).count()
+    return opaque_pixels == surface.get_width() * surface.get_height()
+
+
+def get_peak_memory_mb() -> float:
     """
-    Convert block size to pixels.
+    The most memory the process has used so far, in megabytes.
+    Returns ``0`` on platforms without the ``resource`` module, like Windows.
     """
-    return val * BLOCK_SIZE
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS reports bytes. Linux reports kilobytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
 
 
 def quit():
@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pygame
+from pygame import SRCALPHA
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+from treeshavelegs.logging import game_logger
+from treeshavelegs.utils import is_opaque
+from treeshavelegs.utils.loaders import safe_dump, safe_load
+
+ATLAS_PAGE_SIZE = 1024
+MANIFEST_NAME = "atlas.json"
+
+# (gfx_id, graphic, area on its page)
+Frame = Tuple[str, Surface, Rect]
+
+
+def pack_atlas(gfx_dir: Path, output_dir: Path, page_size: int = ATLAS_PAGE_SIZE) -> Path:
+    """
+    Pack every graphic in ``gfx_dir``, and its flipped variant, into as few
+    page images as possible. Writes the pages and a manifest to ``output_dir``
+    and returns the manifest's path.
+
+    Flipped variants use the same ``{gfx_id}-right`` IDs as ``GraphicsManager``.
+    Opaque graphics get their own pages, saved without an alpha channel.
+    """
+
+    opaque: List[Tuple[str, Surface]] = []
+    translucent: List[Tuple[str, Surface]] = []
+    for path in sorted(gfx_dir.glob("*.png")):
+        gfx = pygame.image.load(str(path))
+        group = opaque if is_opaque(gfx) else translucent
+        group.append((path.stem, gfx))
+        group.append((f"{path.stem}-right", pygame.transform.flip(gfx, True, False)))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest: Dict = {"pages": [], "frames": {}}
+    for graphics, flags in ((opaque, 0), (translucent, SRCALPHA)):
+        for frames in _pack_shelves(graphics, page_size):
+            index = len(manifest["pages"])
+            page_height = max(rect.bottom for _, _, rect in frames)
+            page = Surface((page_size, page_height), flags)
+            for gfx_id, gfx, rect in frames:
+                page.blit(gfx, rect)
+                manifest["frames"][gfx_id] = {"page": index, "rect": [*rect]}
+
+            page_name = f"atlas-{index}.png"
+            pygame.image.save(page, str(output_dir / page_name))
+            manifest["pages"].append(page_name)
+
+    manifest_path = output_dir / MANIFEST_NAME
+    safe_dump(manifest_path, manifest)
+    game_logger.info(
+        f"Packed {len(manifest['frames'])} graphics into {len(manifest['pages'])} "
+        f"atlas page(s) in '{output_dir}'."
+    )
+    return manifest_path
+
+
+def load_atlas(
+    gfx_dir: Path, atlas_dir: Path, prepare: Callable[[Surface], Surface] | None = None
+) -> Dict[str, Surface]:
+    """
+    Load the packed pages and cut them into subsurfaces by graphic ID.
+    Returns nothing when there is no atlas or a graphic changed since packing,
+    so that callers fall back to the loose files.
+
+    ``prepare`` is called on each page before it is cut, such as to convert it
+    to the display's pixel format.
+    """
+
+    manifest_path = atlas_dir / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return {}
+
+    packed_at = manifest_path.stat().st_mtime
+    if any(p.stat().st_mtime > packed_at for p in gfx_dir.glob("*.png")):
+        game_logger.debug("Graphics atlas is out-of-date. Using loose graphics.")
+        return {}
+
+    manifest = safe_load(manifest_path)
+    pages = [pygame.image.load(str(atlas_dir / name)) for name in manifest.get("pages", [])]
+    if prepare is not None:
+        pages = [prepare(page) for page in pages]
+
+    return {
+        gfx_id: pages[frame["page"]].subsurface(Rect(frame["rect"]))
+        for gfx_id, frame in manifest.get("frames", {}).items()
+    }
+
+
+def _pack_shelves(graphics: List[Tuple[str, Surface]], page_size: int) -> List[List[Frame]]:
+    """
+    Shelf packing: tallest first, left to right, starting a new shelf when a row fills.
+    """
+
+    pages: List[List[Frame]] = []
+    x = y = shelf_height = 0
+    for gfx_id, gfx in sorted(graphics, key=lambda g: (-g[1].get_height(), g[0])):
+        width, height = gfx.get_size()
+        if width > page_size or height > page_size:
+            raise ValueError(f"Graphic '{gfx_id}' does not fit on a {page_size}px atlas page.")
+
+        if x + width > page_size:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+
+        if not pages or y + height > page_size:
+            pages.append([])
+            x = y = shelf_height = 0
+
+        pages[-1].append((gfx_id, gfx, Rect(x, y, width, height)))
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    return pages
@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+from pygame.surface import Surface
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def surface_bytes(surface: Surface) -> int:
+    """
+    The memory used by a surface's pixels.
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A cache that evicts the least-recently used values once the total size
+    of its values goes over ``max_size``. ``sizer`` measures each value and
+    defaults to counting values.
+    """
+
+    def __init__(self, max_size: int, sizer: Callable[[V], int] | None = None) -> None:
+        self.max_size = max_size
+        self.sizer: Callable[[V], int] = sizer or (lambda _: 1)
+        self.size = 0
+        self._values: OrderedDict[K, V] = OrderedDict()
+        self._sizes: Dict[K, int] = {}
+
+        # Counters, for tuning the max size.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._values
+
+    def __setitem__(self, key: K, value: V):
+        if key in self._values:
+            self._discard(key)
+
+        size = self.sizer(value)
+        self._values[key] = value
+        self._sizes[key] = size
+        self.size += size
+
+        # Evict until within budget, but always keep the newest value.
+        while self.size > self.max_size and len(self._values) > 1:
+            oldest = next(iter(self._values))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def get(self, key: K) -> V | None:
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self._values.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def pop(self, key: K) -> V | None:
+        value = self._values.get(key)
+        if value is not None:
+            self._discard(key)
+
+        return value
+
+    def clear(self):
+        self._values.clear()
+        self._sizes.clear()
+        self.size = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "count": len(self),
+        }
+
+    def _discard(self, key: K):
+        del self._values[key]
+        self.size -= self._sizes.pop(key)
@@ -12,6 +12,10 @@ class GamePaths:
     def gfx(self) -> Path:
         return self.base_dir / "gfx"
 
+    @property
+    def atlas(self) -> Path:
+        return self.gfx / "atlas"
+
     @property
     def maps(self) -> Path:
         return self.base_dir / "maps"
@@ -0,0 +1,307 @@
+from bisect import bisect_left, insort
+from itertools import count
+from math import ceil, hypot, inf
+from typing import Dict, Generic, Hashable, Iterator, List, Protocol, Set, Tuple, TypeVar, cast
+
+from pygame.rect import Rect
+from pygame.sprite import Group, Sprite
+
+from treeshavelegs.constants import BLOCK_SIZE
+
+Cell = Tuple[int, int]
+CellRange = Tuple[int, int, int, int]
+
+# The direction the touched side of something faces, such as (-1, 0) for its left side.
+Normal = Tuple[int, int]
+
+
+class Drawable(Protocol):
+    rect: Rect
+
+    def __hash__(self) -> int:
+        ...
+
+
+DrawableT = TypeVar("DrawableT", bound=Drawable)
+
+
+def get_impact(box: Rect, obstacle: Rect, dx: int, dy: int) -> Tuple[float, Normal] | None:
+    """
+    When moving ``box`` by ``(dx, dy)`` would make it overlap ``obstacle``, get how far
+    along the move (0 to 1) they first touch, and the normal of the side touched.
+    Boxes that already overlap hit at the start of any move taking them deeper,
+    but not of moves taking them apart.
+    """
+
+    x_times = _get_axis_times(box.left, box.right, obstacle.left, obstacle.right, dx)
+    if x_times is None:
+        return None
+
+    y_times = _get_axis_times(box.top, box.bottom, obstacle.top, obstacle.bottom, dy)
+    if y_times is None:
+        return None
+
+    x_entry, x_exit = x_times
+    y_entry, y_exit = y_times
+    entry = max(x_entry, y_entry)
+    leave = min(x_exit, y_exit)
+    if entry < 0 < leave:
+        return _get_inward_impact(box, obstacle, dx, dy)
+
+    elif entry < 0 or entry >= 1 or entry >= leave:
+        return None
+
+    elif x_entry >= y_entry:
+        return entry, (-1 if dx > 0 else 1, 0)
+
+    return entry, (0, -1 if dy > 0 else 1)
+
+
+def get_distance(rect: Rect, other: Rect) -> float:
+    """
+    The length of the gap between two rects, or 0 when they touch or overlap.
+    """
+
+    dx = max(other.left - rect.right, rect.left - other.right, 0)
+    dy = max(other.top - rect.bottom, rect.top - other.bottom, 0)
+    return hypot(dx, dy)
+
+
+def _get_inward_impact(box: Rect, obstacle: Rect, dx: int, dy: int) -> Tuple[float, Normal] | None:
+    """
+    For boxes that already overlap, the impact of a move towards the obstacle's center.
+    """
+
+    # Twice the distance between the centers, to keep to whole numbers.
+    to_x = obstacle.left + obstacle.right - box.left - box.right
+    to_y = obstacle.top + obstacle.bottom - box.top - box.bottom
+    if dx * to_x > 0:
+        return 0.0, (-1 if dx > 0 else 1, 0)
+
+    elif dy * to_y > 0:
+        return 0.0, (0, -1 if dy > 0 else 1)
+
+    return None
+
+
+def _get_axis_times(
+    start: int, end: int, other_start: int, other_end: int, delta: int
+) -> Tuple[float, float] | None:
+    """
+    When (0 to 1 of the move) a span starts and stops overlapping another along one axis.
+    """
+
+    if delta > 0:
+        return (other_start - end) / delta, (other_end - start) / delta
+
+    elif delta < 0:
+        return (other_end - start) / delta, (other_start - end) / delta
+
+    elif start < other_end and other_start < end:
+        # Not moving along this axis, and overlapping the whole time.
+        return -inf, inf
+
+    return None
+
+
+class SpatialHash:
+    """
+    A uniform grid mapping cells to the items whose rects touch them.
+    Finding the items in an area only visits the cells covering that area.
+    """
+
+    def __init__(self, cell_size: int = 4 * BLOCK_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, Set[Hashable]] = {}
+        self.ranges: Dict[Hashable, CellRange] = {}
+        self.order: Dict[Hashable, int] = {}
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.ranges
+
+    def insert(self, item: Hashable, rect: Rect):
+        if item in self.ranges:
+            self.update(item, rect)
+            return
+
+        self.order[item] = next(self._counter)
+        self._add(item, self._get_range(rect))
+
+    def update(self, item: Hashable, rect: Rect):
+        cell_range = self._get_range(rect)
+        previous = self.ranges.get(item)
+        if previous == cell_range:
+            # Moved within the same cells.
+            return
+
+        elif previous is None:
+            self.insert(item, rect)
+            return
+
+        self._discard(item, previous)
+        self._add(item, cell_range)
+
+    def remove(self, item: Hashable):
+        cell_range = self.ranges.pop(item, None)
+        if cell_range is None:
+            return
+
+        self._discard(item, cell_range)
+        del self.order[item]
+
+    def query(self, rect: Rect) -> List[Hashable]:
+        """
+        Get the items in cells touching the given rect, in insertion order.
+        The items' rects are not guaranteed to intersect ``rect``.
+        """
+
+        left, top, right, bottom = self._get_range(rect)
+        found: Set[Hashable] = set()
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells.get((x, y))
+                if cell:
+                    found.update(cell)
+
+        return sorted(found, key=self.order.__getitem__)
+
+    def _get_range(self, rect: Rect) -> CellRange:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            max(rect.left, rect.right - 1) // size,
+            max(rect.top, rect.bottom - 1) // size,
+        )
+
+    def _add(self, item: Hashable, cell_range: CellRange):
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self.cells.setdefault((x, y), set()).add(item)
+
+        self.ranges[item] = cell_range
+
+    def _discard(self, item: Hashable, cell_range: CellRange):
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells.get((x, y))
+                if cell is None:
+                    continue
+
+                cell.discard(item)
+                if not cell:
+                    del self.cells[(x, y)]
+
+
+class IndexedGroup(Group):
+    """
+    A sprite group that keeps its sprites in a ``SpatialHash``.
+    ``key`` is the name of the rect attribute to index sprites by.
+    Sprites must call ``reindex()`` on the group after that rect changes.
+    """
+
+    def __init__(self, *sprites: Sprite, key: str = "rect") -> None:
+        self.key = key
+        self.index = SpatialHash()
+
+        # Changes when sprites are added or removed, for anything caching the group.
+        self.version = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, *args, **kwargs):
+        super().add_internal(sprite, *args, **kwargs)
+        self.index.insert(sprite, getattr(sprite, self.key))
+        self.version += 1
+
+    def remove_internal(self, sprite: Sprite):
+        super().remove_internal(sprite)
+        self.index.remove(sprite)
+        self.version += 1
+
+    def reindex(self, sprite: Sprite):
+        if sprite in self.index:
+            self.index.update(sprite, getattr(sprite, self.key))
+
+    def query(self, rect: Rect) -> List[Sprite]:
+        """
+        Get the sprites intersecting the given rect, in the order they were added.
+        """
+
+        key = self.key
+        candidates = cast(List[Sprite], self.index.query(rect))
+        return [s for s in candidates if rect.colliderect(getattr(s, key))]
+
+    def within(self, origin: Rect, radius: float) -> List[Sprite]:
+        """
+        Get the sprites no more than ``radius`` away from the given rect,
+        in the order they were added.
+        """
+
+        key = self.key
+        reach = 2 * ceil(radius)
+        candidates = cast(List[Sprite], self.index.query(origin.inflate(reach, reach)))
+        return [s for s in candidates if get_distance(origin, getattr(s, key)) <= radius]
+
+
+class DepthList(Generic[DrawableT]):
+    """
+    Sprites kept in drawing order, top to bottom by ``rect.centery``.
+    Ties keep the order the sprites were added in.
+    Only sprites whose ``centery`` changed need to be re-inserted.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[Tuple[int, int, DrawableT]] = []
+        self.keys: Dict[DrawableT, Tuple[int, int]] = {}
+        self._counter = count()
+
+        # The tallest sprite's height, as how far a sprite's centery can be from
+        # the rows it covers.
+        self.reach = 0
+
+    def __iter__(self) -> Iterator[DrawableT]:
+        for entry in self.entries:
+            yield entry[2]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, sprite: DrawableT):
+        key = (sprite.rect.centery, next(self._counter))
+        self.keys[sprite] = key
+        self.reach = max(self.reach, sprite.rect.height)
+        insort(self.entries, (*key, sprite))
+
+    def remove(self, sprite: DrawableT):
+        key = self.keys.pop(sprite, None)
+        if key is not None:
+            del self.entries[bisect_left(self.entries, key)]
+
+    def resort(self, sprite: DrawableT):
+        key = self.keys.get(sprite)
+        if key is None or key[0] == sprite.rect.centery:
+            return
+
+        del self.entries[bisect_left(self.entries, key)]
+        new_key = (sprite.rect.centery, key[1])
+        self.keys[sprite] = new_key
+        self.reach = max(self.reach, sprite.rect.height)
+        insort(self.entries, (*new_key, sprite))
+
+    def between(self, top: int, bottom: int) -> Iterator[DrawableT]:
+        """
+        Get the sprites that may cover any of the rows from ``top`` to ``bottom``,
+        in drawing order. Only looks at the part of the list around those rows.
+        """
+
+        entries = self.entries
+        start = bisect_left(entries, (top - self.reach,))
+        end = bisect_left(entries, (bottom + self.reach + 1,))
+        for index in range(start, end):
+            yield entries[index][2]
@@ -1,3 +1,8 @@
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict
+
+from treeshavelegs.constants import PROFILE_WINDOW_FRAMES
 from treeshavelegs.types import Visible
 
 
@@ -17,3 +22,61 @@ class VisibilityTimer:
 
         elif target.visible and self.timer is not None:
             self.timer -= 1
+
+
+class Stopwatch:
+    """
+    Measures the time spent inside ``with`` blocks, in milliseconds.
+    Time adds up across blocks until ``reset()``.
+    """
+
+    def __init__(self) -> None:
+        self.elapsed: float = 0.0
+        self._start: float = 0.0
+
+    def __enter__(self) -> "Stopwatch":
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed += (perf_counter() - self._start) * 1000
+
+    def reset(self):
+        self.elapsed = 0.0
+
+
+class RollingStats:
+    """
+    Keeps the last ``size`` samples, such as one per frame, for percentiles.
+    """
+
+    def __init__(self, size: int = PROFILE_WINDOW_FRAMES) -> None:
+        self.samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, sample: float):
+        self.samples.append(sample)
+
+    def percentile(self, percent: float) -> float:
+        """
+        The sample that ``percent`` (0 to 100) of the samples are at or below.
+        """
+
+        if not self.samples:
+            return 0.0
+
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {
+            "p50": ordered[round(0.50 * last)],
+            "p95": ordered[round(0.95 * last)],
+            "p99": ordered[round(0.99 * last)],
+            "max": ordered[last],
+        }
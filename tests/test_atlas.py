@@ -0,0 +1,65 @@
+import os
+
+import pygame
+from pygame import SRCALPHA
+from pygame.surface import Surface
+
+from treeshavelegs.utils import is_opaque
+from treeshavelegs.utils.atlas import load_atlas, pack_atlas
+
+
+def make_graphic(path, size, color, opaque=False):
+    gfx = Surface(size, SRCALPHA)
+    gfx.fill(color)
+    if not opaque:
+        gfx.set_at((0, 0), (0, 0, 0, 0))
+
+    pygame.image.save(gfx, str(path))
+    return gfx
+
+
+class TestAtlas:
+    def test_pack_and_load(self, tmp_path):
+        gfx_dir = tmp_path / "gfx"
+        gfx_dir.mkdir()
+        graphics = {
+            "tall": make_graphic(gfx_dir / "tall.png", (16, 40), (255, 0, 0, 255)),
+            "wide": make_graphic(gfx_dir / "wide.png", (48, 8), (0, 255, 0, 128)),
+        }
+
+        pack_atlas(gfx_dir, tmp_path / "atlas", page_size=64)
+        atlas = load_atlas(gfx_dir, tmp_path / "atlas")
+        assert set(atlas) == {"tall", "tall-right", "wide", "wide-right"}
+        for gfx_id, gfx in graphics.items():
+            packed = atlas[gfx_id]
+            assert packed.get_size() == gfx.get_size()
+            assert packed.get_at((0, 0)).a == 0
+            assert packed.get_at((1, 1)) == gfx.get_at((1, 1))
+
+            # The transparent corner moves to the other side when flipped.
+            flipped = atlas[f"{gfx_id}-right"]
+            assert flipped.get_at((gfx.get_width() - 1, 0)).a == 0
+
+    def test_opaque_graphics_get_own_page(self, tmp_path):
+        gfx_dir = tmp_path / "gfx"
+        gfx_dir.mkdir()
+        make_graphic(gfx_dir / "ground.png", (8, 8), (0, 128, 0, 255), opaque=True)
+        make_graphic(gfx_dir / "sprite.png", (8, 8), (128, 0, 0, 255))
+        pack_atlas(gfx_dir, tmp_path / "atlas")
+        atlas = load_atlas(gfx_dir, tmp_path / "atlas")
+        assert atlas["ground"].get_parent() is not atlas["sprite"].get_parent()
+        assert is_opaque(atlas["ground"].get_parent())
+        assert not is_opaque(atlas["sprite"].get_parent())
+
+    def test_load_stale_atlas(self, tmp_path):
+        gfx_dir = tmp_path / "gfx"
+        gfx_dir.mkdir()
+        path = gfx_dir / "block.png"
+        make_graphic(path, (8, 8), (0, 0, 255, 255))
+        manifest = pack_atlas(gfx_dir, tmp_path / "atlas")
+        later = manifest.stat().st_mtime + 10
+        os.utime(path, (later, later))
+        assert load_atlas(gfx_dir, tmp_path / "atlas") == {}
+
+    def test_load_missing_atlas(self, tmp_path):
+        assert load_atlas(tmp_path, tmp_path / "atlas") == {}
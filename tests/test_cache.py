@@ -0,0 +1,33 @@
+from treeshavelegs.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    def test_get(self):
+        cache: LRUCache[str, int] = LRUCache(10)
+        cache["a"] = 1
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_sizer(self):
+        cache: LRUCache[str, str] = LRUCache(10, sizer=len)
+        cache["short"] = "abc"
+        cache["long"] = "abcdefgh"
+        assert "short" not in cache
+        assert cache.size == 8
+
+    def test_keeps_oversized_value(self):
+        cache: LRUCache[str, str] = LRUCache(1, sizer=len)
+        cache["big"] = "too big"
+        assert cache.get("big") == "too big"
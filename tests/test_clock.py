@@ -0,0 +1,30 @@
+import pytest
+
+from treeshavelegs.managers.clock import MAX_TICKS_PER_FRAME, ClockManager
+from treeshavelegs.managers.options import options_manager
+from treeshavelegs.types import GameOptions
+
+
+@pytest.fixture
+def clock():
+    options_manager.load(GameOptions(tick_rate=10))
+    return ClockManager()
+
+
+class TestClockManager:
+    def test_steps(self, clock):
+        clock.accumulator = 0.25
+        assert list(clock.steps()) == [1, 2]
+        assert clock.deltatime == 0.1
+        assert clock.alpha == pytest.approx(0.5)
+
+    def test_steps_carry_over(self, clock):
+        clock.accumulator = 0.05
+        assert list(clock.steps()) == []
+        clock.accumulator += 0.05
+        assert list(clock.steps()) == [1]
+
+    def test_steps_drop_backlog(self, clock):
+        clock.accumulator = 60.0
+        assert len(list(clock.steps())) == MAX_TICKS_PER_FRAME
+        assert clock.accumulator < clock.deltatime
@@ -0,0 +1,94 @@
+import pytest
+from pygame.rect import Rect
+from pygame.sprite import Sprite
+
+from treeshavelegs.managers.collision import EASE_LIMIT, CollisionManager
+from treeshavelegs.managers.options import options_manager
+from treeshavelegs.sprites.base import MobileSprite
+from treeshavelegs.types import GameOptions
+
+
+class Box(Sprite):
+    def __init__(self, name: str, x: int, y: int) -> None:
+        super().__init__()
+        self.name = name
+        self.hitbox = Rect(x, y, 10, 10)
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class Mover(MobileSprite):
+    # At full ease, moves 4.5 pixels per tick.
+    speed = 4.5 / EASE_LIMIT
+
+    def __init__(self, name: str, x: int, y: int) -> None:
+        Sprite.__init__(self)
+        self.sprite_id = name
+        self.hitbox = Rect(x, y, 10, 10)
+
+    def __repr__(self) -> str:
+        return self.sprite_id
+
+
+@pytest.fixture
+def load_collision():
+    loaded = options_manager.loaded
+
+    def load(margin: int) -> CollisionManager:
+        options_manager.load(GameOptions(broadphase_margin=margin))
+        return CollisionManager()
+
+    yield load
+    options_manager.loaded = loaded
+
+
+@pytest.fixture
+def collision(load_collision):
+    return load_collision(20)
+
+
+class TestBroadphase:
+    def test_neighbors(self, collision):
+        a, b, c = Box("a", 0, 0), Box("b", 25, 0), Box("c", 100, 0)
+        collision.group.add(a, b, c)
+        collision.update()
+        assert collision.neighbors(a) == [b]
+        assert collision.neighbors(c) == []
+
+    def test_neighbors_in_order_added(self, collision):
+        boxes = [Box(name, x, 0) for name, x in (("c", 30), ("a", 0), ("b", 15))]
+        collision.group.add(*boxes)
+        collision.update()
+        assert collision.neighbors(boxes[2]) == boxes[:2]
+
+    def test_moved(self, collision):
+        a, b, c = Box("a", 0, 0), Box("b", 25, 0), Box("c", 100, 0)
+        collision.group.add(a, b, c)
+        collision.update()
+
+        b.hitbox.x = 85
+        collision.group.reindex(b)
+        collision.update()
+        assert collision.builds == 1
+        assert collision.neighbors(a) == []
+        assert collision.neighbors(b) == [c]
+        assert collision.neighbors(c) == [b]
+
+    def test_removed(self, collision):
+        a, b = Box("a", 0, 0), Box("b", 25, 0)
+        collision.group.add(a, b)
+        collision.update()
+        b.kill()
+        assert collision.neighbors(a) == []
+        assert collision.pairs_found == 1
+
+    def test_no_margin(self, load_collision):
+        collision = load_collision(0)
+        a, b = Mover("a", 11, 0), Mover("b", 30, 0)
+        collision.group.add(a, b)
+        collision.update()
+
+        # Rounded, a moves from x=11 to round(15.5) = 16 and b from x=30 to
+        # round(25.5) = 26. 5 pixels each close the 9 pixel gap between them.
+        assert collision.neighbors(a) == [b]
@@ -0,0 +1,78 @@
+import json
+
+import pygame
+import pytest
+from pygame import K_ESCAPE, K_RETURN, K_a
+
+from treeshavelegs.game import Game
+from treeshavelegs.types import GameOptions, UserInput, WorldStage
+
+
+@pytest.fixture(scope="module")
+def game():
+    game = Game(GameOptions(stage=WorldStage.GET_TAYLOR_BACK, headless=True, ticks=1))
+    game.setup()
+    return game
+
+
+class TestEventManager:
+    def test_flooded_queue_runs_one_frame(self, game):
+        frames = 0
+        tick = game.display.tick
+
+        def count_frames():
+            nonlocal frames
+            frames += 1
+            tick()
+
+        game.display.tick = count_frames
+        handled = []
+        handle_event = game.world.handle_event
+        game.world.handle_event = lambda e: handled.append(e) or handle_event(e)
+        try:
+            pygame.event.clear()
+            for _ in range(200):
+                pygame.event.post(pygame.event.Event(UserInput.KEY_DOWN, key=K_a))
+                pygame.event.post(pygame.event.Event(UserInput.KEY_UP, key=K_a))
+
+            ticks = game.clock.ticks
+            game.react()
+
+        finally:
+            del game.display.tick
+            del game.world.handle_event
+
+        assert len(handled) == 400
+        assert frames == 1
+        assert game.clock.ticks - ticks <= 1
+
+    def test_replay_through_menu(self, game, tmp_path):
+        # While the menu is open, the clock is paused. So, the keys that open and
+        # leave the menu are recorded on the same tick.
+        tick = game.clock.ticks + 2
+        entries = [
+            {option: game.options[option] for option in ("stage", "tick_rate", "seed")},
+            {"tick": tick, "type": UserInput.KEY_DOWN, "key": K_ESCAPE},
+            {"tick": tick, "type": UserInput.KEY_DOWN, "key": K_RETURN},
+            {"end": tick + 5},
+        ]
+        path = tmp_path / "session.jsonl"
+        path.write_text("".join(f"{json.dumps(entry)}\n" for entry in entries))
+        game.options["replay"] = path
+        game.input.load_replay()
+        try:
+            for _ in range(20):
+                if game.input.finished:
+                    break
+
+                game.react()
+
+            finished = game.input.finished
+
+        finally:
+            game.input.end_tick = None
+            game.options["replay"] = None
+
+        assert finished
+        assert game.views.active is game.world
+        assert game.clock.ticks == tick + 5
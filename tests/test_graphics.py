@@ -0,0 +1,70 @@
+import os
+
+import pygame
+import pytest
+from pygame import SRCALPHA
+from pygame.surface import Surface
+
+from treeshavelegs.managers.graphics import GraphicsManager
+
+VARIANTS = ({"scale": (2, 3)}, {"alpha": 128}, {"tint": (255, 0, 0)})
+
+
+def make_graphic(opaque: bool) -> Surface:
+    gfx = Surface((4, 2), SRCALPHA)
+    gfx.fill((200, 100, 50, 255))
+    if not opaque:
+        gfx.set_at((0, 0), (0, 0, 0, 0))
+
+    return gfx
+
+
+@pytest.fixture
+def graphics():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    graphics = GraphicsManager()
+
+    # Keep the shared cache out of it, and load from memory instead of files.
+    graphics.gfx_cache = {}
+    graphics.__dict__["atlas"] = {}
+    graphics.load = lambda gfx_id: graphics.prepare(make_graphic(gfx_id == "opaque"))
+    yield graphics
+    pygame.display.quit()
+
+
+class TestGraphicsManager:
+    def test_identify(self, graphics):
+        assert graphics.identify(graphics["opaque"]) == ("opaque", False)
+        assert graphics.identify(graphics.get("opaque", flip_x=True)) == ("opaque", True)
+        assert graphics.identify(make_graphic(True)) is None
+
+    def test_variants_cached(self, graphics):
+        for kwargs in VARIANTS:
+            variant = graphics.get_variant("opaque", **kwargs)
+            assert variant is not graphics["opaque"]
+            assert graphics.get_variant("opaque", **kwargs) is variant
+
+        assert graphics.get_variant("opaque", scale=(2, 3)).get_size() == (8, 6)
+        assert len(graphics.variants) == len(VARIANTS)
+        assert graphics.variants.misses == len(VARIANTS)
+
+    def test_fade_opaque(self, graphics):
+        gfx = graphics["opaque"]
+        assert not gfx.get_flags() & SRCALPHA
+
+        faded = graphics.get_variant("opaque", alpha=128)
+        assert faded.get_flags() & SRCALPHA
+        assert faded.get_at((1, 1)) == (200, 100, 50, 128)
+
+    @pytest.mark.parametrize("gfx_id", ("opaque", "transparent"))
+    def test_original_unchanged(self, graphics, gfx_id):
+        gfx = graphics[gfx_id]
+        pixels = pygame.image.tobytes(gfx, "RGBA")
+        for kwargs in VARIANTS:
+            graphics.get_variant(gfx_id, **kwargs)
+
+        graphics.get_variant(gfx_id, alpha=64, tint=(0, 0, 255))
+        assert graphics[gfx_id] is gfx
+        assert pygame.image.tobytes(gfx, "RGBA") == pixels
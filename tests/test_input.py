@@ -0,0 +1,75 @@
+import os
+from collections import defaultdict
+
+import pygame
+import pytest
+from pygame import K_RIGHT, K_SPACE
+
+from treeshavelegs.managers import input as input_module
+from treeshavelegs.managers.clock import clock_manager
+from treeshavelegs.managers.input import InputManager
+from treeshavelegs.managers.options import options_manager
+from treeshavelegs.managers.rng import RNGManager
+from treeshavelegs.types import GameOptions, UserInput
+
+
+@pytest.fixture
+def load_options():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    loaded, ticks = options_manager.loaded, clock_manager.ticks
+    yield lambda **kwargs: options_manager.load(GameOptions(**kwargs))
+    options_manager.loaded, clock_manager.ticks = loaded, ticks
+
+
+class TestInputManager:
+    def test_record_and_replay(self, tmp_path, monkeypatch, load_options):
+        path = tmp_path / "session.jsonl"
+        load_options(stage=1, tick_rate=20, record=path)
+        recorder = InputManager()
+        recorder.load()
+        recorder.start()
+        monkeypatch.setattr(input_module, "get_pressed", lambda: defaultdict(bool, {K_RIGHT: True}))
+
+        pygame.event.clear()
+        clock_manager.ticks = 3
+        pygame.event.post(pygame.event.Event(UserInput.KEY_DOWN, key=K_SPACE))
+        assert [e.key for e in recorder.get_events()] == [K_SPACE]
+        clock_manager.ticks = 5
+        recorder.get_pressed()
+        clock_manager.ticks = 10
+        recorder.stop_recording()
+
+        load_options(replay=path)
+        replayer = InputManager()
+        replayer.load()
+        assert options_manager.stage == 1
+        assert options_manager.tick_rate == 20
+
+        clock_manager.ticks = 0
+        assert replayer.get_events() == []
+        assert not replayer.get_pressed()[K_RIGHT]
+        clock_manager.ticks = 3
+        assert [(e.type, e.key) for e in replayer.get_events()] == [(UserInput.KEY_DOWN, K_SPACE)]
+        clock_manager.ticks = 5
+        assert replayer.get_pressed()[K_RIGHT]
+        assert not replayer.finished
+        clock_manager.ticks = 10
+        assert replayer.finished
+
+    def test_replay_reuses_random_seed(self, tmp_path, load_options):
+        path = tmp_path / "session.jsonl"
+        load_options(record=path)
+        recorder, recorder_rng = InputManager(), RNGManager()
+        recorder.load()
+        recorder_rng.load()
+        recorder.start()
+        recorder.stop_recording()
+        assert recorder_rng.seed is not None
+
+        load_options(replay=path)
+        replayer, replayer_rng = InputManager(), RNGManager()
+        replayer.load()
+        replayer_rng.load()
+        assert replayer_rng.seed == recorder_rng.seed
+        assert replayer_rng.ai.integers(0, 9, 10) == recorder_rng.ai.integers(0, 9, 10)
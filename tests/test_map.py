@@ -0,0 +1,35 @@
+from pygame.rect import Rect
+
+from treeshavelegs.constants import BLOCK_SIZE, Maps
+from treeshavelegs.managers.map import MapManager
+
+
+class TestMapManager:
+    def test_solid(self):
+        manager = MapManager()
+        loaded = manager.load(Maps.FIRE_PIT)
+        assert len(manager.solid) == loaded.width * loaded.height
+
+        # Void border and debris collide. Grass does not.
+        assert manager.solid[0]
+        assert manager.solid[loaded.width + 1]
+        assert not manager.solid[2 * loaded.width + 2]
+
+    def test_solid_cells(self):
+        manager = MapManager()
+        manager.load(Maps.FIRE_PIT)
+        grass = Rect(3 * BLOCK_SIZE, 4 * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+        assert list(manager.solid_cells(grass)) == []
+
+        # Touching the corner of the debris at (1, 2) from the grass at (2, 3).
+        corner = Rect(2 * BLOCK_SIZE - 1, 3 * BLOCK_SIZE - 1, BLOCK_SIZE, BLOCK_SIZE)
+        assert list(manager.solid_cells(corner)) == [(1, 2)]
+
+        # Row by row.
+        between = Rect(BLOCK_SIZE + 5, BLOCK_SIZE + 5, BLOCK_SIZE, BLOCK_SIZE)
+        assert list(manager.solid_cells(between)) == [(1, 1), (2, 1), (1, 2)]
+
+    def test_solid_cells_outside_map(self):
+        manager = MapManager()
+        manager.load(Maps.FIRE_PIT)
+        assert list(manager.solid_cells(Rect(-100, -100, 10, 10))) == []
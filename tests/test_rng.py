@@ -0,0 +1,29 @@
+from treeshavelegs.managers.rng import RandomStream, RNGManager
+
+
+class TestRNGManager:
+    def test_same_seed_same_numbers(self):
+        first, second = RNGManager(), RNGManager()
+        first.reseed(123)
+        second.reseed(123)
+        assert first.ai.integers(0, 9, 10) == second.ai.integers(0, 9, 10)
+
+    def test_other_seed_other_numbers(self):
+        first, second = RNGManager(), RNGManager()
+        first.reseed(123)
+        second.reseed(456)
+        assert first.ai.integers(0, 9, 10) != second.ai.integers(0, 9, 10)
+
+
+class TestRandomStream:
+    def test_chance(self):
+        stream = RandomStream(0)
+        assert all(stream.chance((1, 1)) for _ in range(100))
+        assert not any(stream.chance((0, 1)) for _ in range(100))
+        hits = sum(stream.chance((1, 4)) for _ in range(10_000))
+        assert 2_000 < hits < 3_000
+
+    def test_integers(self):
+        draws = RandomStream(0).integers(-1, 1, 1_000)
+        assert len(draws) == 1_000
+        assert set(draws) == {-1, 0, 1}
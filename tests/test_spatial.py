@@ -0,0 +1,152 @@
+from pygame.rect import Rect
+from pygame.sprite import Sprite
+
+from treeshavelegs.utils.spatial import (
+    DepthList,
+    IndexedGroup,
+    SpatialHash,
+    get_distance,
+    get_impact,
+)
+
+
+class Box(Sprite):
+    def __init__(self, x: int, y: int) -> None:
+        super().__init__()
+        self.rect = Rect(x, y, 10, 10)
+
+
+class TestSpatialHash:
+    def test_query(self):
+        index = SpatialHash(cell_size=32)
+        index.insert("near", Rect(0, 0, 32, 32))
+        index.insert("far", Rect(1000, 1000, 32, 32))
+        assert index.query(Rect(0, 0, 64, 64)) == ["near"]
+
+    def test_query_keeps_insertion_order(self):
+        index = SpatialHash(cell_size=32)
+        for name in ("c", "a", "b"):
+            index.insert(name, Rect(10, 10, 64, 64))
+
+        assert index.query(Rect(0, 0, 100, 100)) == ["c", "a", "b"]
+
+    def test_update(self):
+        index = SpatialHash(cell_size=32)
+        index.insert("mover", Rect(0, 0, 32, 32))
+        index.update("mover", Rect(500, 500, 32, 32))
+        assert index.query(Rect(0, 0, 32, 32)) == []
+        assert index.query(Rect(500, 500, 1, 1)) == ["mover"]
+
+    def test_remove(self):
+        index = SpatialHash(cell_size=32)
+        index.insert("gone", Rect(0, 0, 100, 100))
+        index.remove("gone")
+        assert "gone" not in index
+        assert index.query(Rect(0, 0, 100, 100)) == []
+        assert not index.cells
+
+
+class TestIndexedGroup:
+    def test_within(self):
+        near, corner, far = Box(25, 0), Box(18, 18), Box(40, 0)
+        group = IndexedGroup(far, corner, near)
+        assert group.within(Rect(0, 0, 10, 10), 15) == [corner, near]
+        assert group.within(Rect(0, 0, 10, 10), 5) == []
+
+    def test_within_point(self):
+        box = Box(100, 100)
+        group = IndexedGroup(box)
+        assert group.within(Rect(95, 95, 0, 0), 8) == [box]
+        assert group.within(Rect(95, 95, 0, 0), 7) == []
+
+
+class TestDepthList:
+    def test_order(self):
+        low, high, tied = Box(0, 50), Box(0, 0), Box(0, 0)
+        depth_list: DepthList[Box] = DepthList()
+        for box in (low, high, tied):
+            depth_list.add(box)
+
+        # Top to bottom, and ties in the order added.
+        assert list(depth_list) == [high, tied, low]
+
+    def test_resort(self):
+        a, b, c = Box(0, 0), Box(0, 20), Box(0, 40)
+        depth_list: DepthList[Box] = DepthList()
+        for box in (a, b, c):
+            depth_list.add(box)
+
+        a.rect.y = 30
+        depth_list.resort(a)
+        assert list(depth_list) == [b, a, c]
+
+        # Moving level with another keeps the order they were added in.
+        c.rect.y = 30
+        depth_list.resort(c)
+        assert list(depth_list) == [b, a, c]
+        a.rect.y = 100
+        depth_list.resort(a)
+        assert list(depth_list) == [b, c, a]
+
+    def test_remove(self):
+        a, b = Box(0, 0), Box(0, 0)
+        depth_list: DepthList[Box] = DepthList()
+        depth_list.add(a)
+        depth_list.add(b)
+        depth_list.remove(a)
+        assert list(depth_list) == [b]
+
+    def test_between(self):
+        boxes = [Box(0, y) for y in range(0, 250, 50)]
+        depth_list: DepthList[Box] = DepthList()
+        for box in reversed(boxes):
+            depth_list.add(box)
+
+        # The ones reaching into the rows, in drawing order.
+        assert list(depth_list.between(55, 100)) == boxes[1:3]
+        assert list(depth_list.between(300, 400)) == []
+
+
+class TestGetDistance:
+    def test_apart(self):
+        assert get_distance(Rect(0, 0, 10, 10), Rect(13, 14, 10, 10)) == 5
+        assert get_distance(Rect(13, 14, 10, 10), Rect(0, 0, 10, 10)) == 5
+
+    def test_touching(self):
+        assert get_distance(Rect(0, 0, 10, 10), Rect(10, 5, 10, 10)) == 0
+        assert get_distance(Rect(0, 0, 10, 10), Rect(2, 2, 4, 4)) == 0
+
+
+class TestGetImpact:
+    def test_hit(self):
+        box = Rect(0, 0, 10, 10)
+        wall = Rect(20, 0, 10, 10)
+        assert get_impact(box, wall, 20, 0) == (0.5, (-1, 0))
+        assert get_impact(Rect(25, 30, 10, 10), wall, 0, -40) == (0.5, (0, 1))
+
+    def test_miss(self):
+        box = Rect(0, 0, 10, 10)
+        assert get_impact(box, Rect(20, 0, 10, 10), 10, 0) is None
+        assert get_impact(box, Rect(20, 10, 10, 10), 20, 0) is None
+        assert get_impact(box, Rect(20, 0, 10, 10), -20, 0) is None
+
+    def test_does_not_tunnel(self):
+        box = Rect(0, 0, 10, 10)
+        assert get_impact(box, Rect(50, 0, 5, 10), 100, 0) == (0.4, (-1, 0))
+
+    def test_touching(self):
+        box = Rect(0, 0, 10, 10)
+        assert get_impact(box, Rect(10, 0, 10, 10), 5, 0) == (0.0, (-1, 0))
+        assert get_impact(box, Rect(10, 0, 10, 10), 0, 5) is None
+
+    def test_overlapping_moving_apart(self):
+        assert get_impact(Rect(0, 0, 10, 10), Rect(5, 5, 10, 10), -5, -5) is None
+        assert get_impact(Rect(0, 0, 10, 10), Rect(5, 5, 10, 10), 0, -5) is None
+
+    def test_overlapping_moving_inward(self):
+        box, obstacle = Rect(0, 0, 10, 10), Rect(5, 5, 10, 10)
+        assert get_impact(box, obstacle, 5, 5) == (0.0, (-1, 0))
+        assert get_impact(box, obstacle, -5, 5) == (0.0, (0, -1))
+
+        # Not through it, however far the move.
+        assert get_impact(box, obstacle, 100, 0) == (0.0, (-1, 0))
@@ -0,0 +1,63 @@
+import pytest
+from pygame.rect import Rect
+from pygame.sprite import Sprite
+
+from treeshavelegs.managers.collision import CollisionManager
+from treeshavelegs.managers.options import options_manager
+from treeshavelegs.managers.sprite import SpriteManager
+from treeshavelegs.sprites.base import InteractiveSprite, MobileSprite
+from treeshavelegs.types import GameOptions
+
+
+class Walker(MobileSprite):
+    def __init__(self, name: str, x: int, y: int) -> None:
+        Sprite.__init__(self)
+        self.sprite_id = name
+        self.hitbox = Rect(x, y, 10, 10)
+        self.visible = True
+
+    def __repr__(self) -> str:
+        return self.sprite_id
+
+
+class Item(Walker, InteractiveSprite):
+    pass
+
+
+@pytest.fixture
+def sprites():
+    loaded = options_manager.loaded
+    options_manager.load(GameOptions())
+    manager = SpriteManager()
+    manager.__dict__["collision"] = CollisionManager()
+    yield manager
+    options_manager.loaded = loaded
+
+
+class TestWithin:
+    def test_within(self, sprites):
+        origin, near, far = Item("origin", 0, 0), Item("near", 15, 0), Item("far", 40, 0)
+        sprites.collision.group.add(origin, near, far)
+        assert sprites.within(origin, 10) == [near]
+        assert sprites.within(origin, 30) == [near, far]
+
+    def test_within_kind(self, sprites):
+        origin, item, walker = Item("origin", 0, 0), Item("item", 15, 0), Walker("walker", 0, 15)
+        sprites.collision.group.add(origin, walker, item)
+        assert sprites.within(origin, 10) == [item]
+        assert sprites.within(origin, 10, kind=Walker) == [walker, item]
+
+    def test_within_skips_origin(self, sprites):
+        origin, other = Item("origin", 0, 0), Item("other", 0, 0)
+        sprites.collision.group.add(origin, other)
+        assert sprites.within(origin, 0) == [other]
+
+        # A rect or point is not a sprite, so nothing is left out.
+        assert sprites.within(origin.hitbox, 0) == [origin, other]
+        assert sprites.within((5, 5), 0) == [origin, other]
+
+    def test_within_skips_invisible(self, sprites):
+        origin, hidden, shown = Item("origin", 0, 0), Item("hidden", 15, 0), Item("shown", 0, 15)
+        sprites.collision.group.add(origin, hidden, shown)
+        hidden.visible = False
+        assert sprites.within(origin, 10) == [shown]
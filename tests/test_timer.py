@@ -0,0 +1,25 @@
+from treeshavelegs.utils.timer import RollingStats
+
+
+class TestRollingStats:
+    def test_summary(self):
+        stats = RollingStats()
+        for sample in range(1, 101):
+            stats.add(sample)
+
+        summary = stats.summary()
+        assert summary["p50"] == 51
+        assert summary["p95"] == 95
+        assert summary["p99"] == 99
+        assert summary["max"] == 100
+        assert stats.percentile(50) == summary["p50"]
+
+    def test_keeps_recent_samples(self):
+        stats = RollingStats(size=3)
+        for sample in (100, 1, 2, 3):
+            stats.add(sample)
+
+        assert stats.summary()["max"] == 3
+
+    def test_empty(self):
+        assert RollingStats().summary() == {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}